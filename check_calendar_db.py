@@ -1,16 +1,31 @@
-
+import argparse
 import asyncio
-from sqlalchemy import select
+from sqlalchemy import case, func, select
 from server.app.core.database import AsyncSessionLocal
 from server.app.domain.calendar.models.calendar_connection import CalendarConnection
 
-async def check_db():
+async def check_db(verbose: bool = False):
     async with AsyncSessionLocal() as session:
-        result = await session.execute(select(CalendarConnection))
-        connections = result.scalars().all()
-        print(f"Total connections: {len(connections)}")
-        for conn in connections:
-            print(f"ID: {conn.id}, UserID: {conn.user_id}, GoogleID: {conn.google_calendar_id}, Active: {conn.is_active}")
+        # Summary comes back as a single aggregate row instead of hydrating
+        # every connection as an ORM instance.
+        total, active = (await session.execute(
+            select(
+                func.count(),
+                func.coalesce(func.sum(case((CalendarConnection.is_active, 1), else_=0)), 0),
+            )
+        )).one()
+        print(f"Total connections: {total} (active: {active})")
+
+        if verbose:
+            # Stream rows in batches so a large table never sits in memory at once
+            stream = await session.stream(
+                select(CalendarConnection).execution_options(yield_per=1000)
+            )
+            async for conn in stream.scalars():
+                print(f"ID: {conn.id}, UserID: {conn.user_id}, GoogleID: {conn.google_calendar_id}, Active: {conn.is_active}")
 
 if __name__ == "__main__":
-    asyncio.run(check_db())
+    parser = argparse.ArgumentParser(description="Inspect calendar connections")
+    parser.add_argument("--verbose", action="store_true", help="print every connection row")
+    args = parser.parse_args()
+    asyncio.run(check_db(verbose=args.verbose))
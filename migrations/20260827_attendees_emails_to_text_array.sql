@@ -0,0 +1,27 @@
+-- ====================
+-- calendar_events.attendees_emails를 JSONB에서 네이티브 배열로 변경
+-- 생성일: 2026-08-27
+-- 설명: 이메일 목록을 VARCHAR(320)[]로 저장하여 로드 시 JSON 파싱을 제거하고,
+--       향후 이메일 기반 조회를 위한 GIN 인덱스를 추가합니다.
+-- ====================
+
+ALTER TABLE calendar_events
+    ALTER COLUMN attendees_emails DROP DEFAULT,
+    ALTER COLUMN attendees_emails TYPE VARCHAR(320)[]
+        USING COALESCE(
+            ARRAY(SELECT jsonb_array_elements_text(attendees_emails)),
+            '{}'
+        ),
+    ALTER COLUMN attendees_emails SET DEFAULT '{}';
+
+-- 향후 WHERE 'a@b.com' = ANY(attendees_emails) 조회용
+CREATE INDEX IF NOT EXISTS ix_calendar_events_attendees_emails
+    ON calendar_events USING GIN (attendees_emails);
+
+-- 롤백 (필요시)
+-- DROP INDEX IF EXISTS ix_calendar_events_attendees_emails;
+-- ALTER TABLE calendar_events
+--     ALTER COLUMN attendees_emails DROP DEFAULT,
+--     ALTER COLUMN attendees_emails TYPE JSONB
+--         USING to_jsonb(attendees_emails),
+--     ALTER COLUMN attendees_emails SET DEFAULT '[]'::jsonb;
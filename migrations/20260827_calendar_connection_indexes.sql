@@ -0,0 +1,19 @@
+-- ====================
+-- calendar_connections 인덱스를 조회 패턴에 맞게 재정비
+-- 생성일: 2026-08-27
+-- 설명: user_id 단독 인덱스는 (user_id, google_calendar_id) 고유 제약
+--       인덱스가 대체하고, 저선택도 is_active 단독 인덱스는 활성 연동
+--       조회(find_active_by_user_id)용 부분 인덱스로 교체합니다.
+-- ====================
+
+DROP INDEX IF EXISTS ix_calendar_connections_user_id;
+DROP INDEX IF EXISTS ix_calendar_connections_is_active;
+
+CREATE INDEX IF NOT EXISTS ix_calendar_connections_user_active
+    ON calendar_connections(user_id)
+    WHERE is_active IS TRUE;
+
+-- 롤백 (필요시)
+-- DROP INDEX IF EXISTS ix_calendar_connections_user_active;
+-- CREATE INDEX IF NOT EXISTS ix_calendar_connections_user_id ON calendar_connections(user_id);
+-- CREATE INDEX IF NOT EXISTS ix_calendar_connections_is_active ON calendar_connections(is_active);
@@ -0,0 +1,24 @@
+-- ====================
+-- calendar_events 인덱스를 실제 조회 패턴에 맞게 재정비
+-- 생성일: 2026-08-27
+-- 설명: 저선택도/중복 단독 인덱스 5개를 제거하고, "연동별 기간 조회 + 최신순"
+--       을 담당하는 복합 인덱스 하나로 대체합니다. (connection, google_event)
+--       조회는 테이블 생성 시의 UNIQUE 제약 인덱스가 담당합니다.
+-- ====================
+
+DROP INDEX IF EXISTS ix_calendar_events_connection_id;
+DROP INDEX IF EXISTS ix_calendar_events_google_event_id;
+DROP INDEX IF EXISTS ix_calendar_events_start_time;
+DROP INDEX IF EXISTS ix_calendar_events_is_filtered;
+DROP INDEX IF EXISTS ix_calendar_events_is_selected;
+
+CREATE INDEX IF NOT EXISTS ix_calendar_events_conn_start
+    ON calendar_events(calendar_connection_id, start_time);
+
+-- 롤백 (필요시)
+-- DROP INDEX IF EXISTS ix_calendar_events_conn_start;
+-- CREATE INDEX IF NOT EXISTS ix_calendar_events_connection_id ON calendar_events(calendar_connection_id);
+-- CREATE INDEX IF NOT EXISTS ix_calendar_events_google_event_id ON calendar_events(google_event_id);
+-- CREATE INDEX IF NOT EXISTS ix_calendar_events_start_time ON calendar_events(start_time);
+-- CREATE INDEX IF NOT EXISTS ix_calendar_events_is_filtered ON calendar_events(is_filtered);
+-- CREATE INDEX IF NOT EXISTS ix_calendar_events_is_selected ON calendar_events(is_selected);
@@ -0,0 +1,25 @@
+-- ====================
+-- 백그라운드 캘린더 동기화 작업 테이블 추가
+-- 생성일: 2026-08-27
+-- 설명: POST /calendar/sync가 202로 즉시 응답하고 실제 동기화는
+--       백그라운드에서 수행하도록 작업 상태/결과 카운터를 저장합니다.
+-- ====================
+
+CREATE TABLE IF NOT EXISTS calendar_sync_jobs (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+    error TEXT,
+    synced_count INTEGER DEFAULT 0,
+    filtered_count INTEGER DEFAULT 0,
+    new_count INTEGER DEFAULT 0,
+    updated_count INTEGER DEFAULT 0,
+    created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS ix_calendar_sync_jobs_user_created
+    ON calendar_sync_jobs(user_id, created_at);
+
+-- 롤백 (필요시)
+-- DROP TABLE IF EXISTS calendar_sync_jobs;
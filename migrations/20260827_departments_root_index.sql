@@ -0,0 +1,14 @@
+-- ====================
+-- departments 루트 부서 조회용 부분 인덱스 추가
+-- 생성일: 2026-08-27
+-- 설명: get_root_department(parent_id IS NULL 조건)가 departments 전체를
+--       순차 스캔하지 않도록 루트 행만 담는 부분 인덱스를 추가합니다.
+--       NULL 행만 포함하므로 인덱스 크기도 최소화됩니다.
+-- ====================
+
+CREATE INDEX IF NOT EXISTS ix_departments_company_root
+    ON departments(company_id)
+    WHERE parent_id IS NULL;
+
+-- 롤백 (필요시)
+-- DROP INDEX IF EXISTS ix_departments_company_root;
@@ -0,0 +1,19 @@
+-- ====================
+-- departments 루트 부분 인덱스를 UNIQUE로 승격
+-- 생성일: 2026-08-27
+-- 설명: "회사당 루트 부서 하나" 불변식을 DB 제약으로 보장하고, 시딩이
+--       INSERT ... ON CONFLICT DO NOTHING의 중재 인덱스로 사용할 수
+--       있게 합니다. 조회 성능은 기존 부분 인덱스와 동일합니다.
+-- ====================
+
+DROP INDEX IF EXISTS ix_departments_company_root;
+
+CREATE UNIQUE INDEX IF NOT EXISTS ix_departments_company_root
+    ON departments(company_id)
+    WHERE parent_id IS NULL;
+
+-- 롤백 (필요시)
+-- DROP INDEX IF EXISTS ix_departments_company_root;
+-- CREATE INDEX IF NOT EXISTS ix_departments_company_root
+--     ON departments(company_id)
+--     WHERE parent_id IS NULL;
@@ -0,0 +1,15 @@
+-- ====================
+-- users.refresh_token을 원문 JWT 대신 blake2b 해시(BYTEA)로 저장
+-- 생성일: 2026-08-27
+-- 설명: 300~500바이트 JWT 원문 대신 16바이트 해시를 저장합니다. 기존 토큰은
+--       재해시할 수 없으므로 NULL로 초기화합니다 (사용자는 재로그인 필요).
+-- ====================
+
+ALTER TABLE users
+    ALTER COLUMN refresh_token TYPE BYTEA USING NULL::bytea;
+
+UPDATE users SET refresh_token_expires_at = NULL;
+
+-- 롤백 (필요시)
+-- ALTER TABLE users
+--     ALTER COLUMN refresh_token TYPE TEXT USING NULL::text;
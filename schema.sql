@@ -18,6 +18,10 @@ CREATE TABLE IF NOT EXISTS departments (
     name VARCHAR(100) NOT NULL
 );
 CREATE INDEX IF NOT EXISTS ix_departments_company_id ON departments(company_id);
+-- 루트 부서(parent_id IS NULL) 조회용 부분 고유 인덱스 (회사당 루트 하나)
+CREATE UNIQUE INDEX IF NOT EXISTS ix_departments_company_root
+    ON departments(company_id)
+    WHERE parent_id IS NULL;
 
 -- 3. Create Users Table
 CREATE TABLE IF NOT EXISTS users (
@@ -29,7 +33,7 @@ CREATE TABLE IF NOT EXISTS users (
     name VARCHAR(100) NOT NULL,
     role VARCHAR(20) DEFAULT 'member',
     profile_image VARCHAR(500),
-    refresh_token TEXT,
+    refresh_token BYTEA,
     refresh_token_expires_at TIMESTAMPTZ,
     created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
@@ -79,8 +83,7 @@ CREATE TABLE IF NOT EXISTS calendar_connections (
     updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
     UNIQUE(user_id, google_calendar_id)
 );
-CREATE INDEX IF NOT EXISTS ix_calendar_connections_user_id ON calendar_connections(user_id);
-CREATE INDEX IF NOT EXISTS ix_calendar_connections_is_active ON calendar_connections(is_active);
+CREATE INDEX IF NOT EXISTS ix_calendar_connections_user_active ON calendar_connections(user_id) WHERE is_active IS TRUE;
 
 -- 7. Create Calendar Events Table
 CREATE TABLE IF NOT EXISTS calendar_events (
@@ -92,7 +95,7 @@ CREATE TABLE IF NOT EXISTS calendar_events (
     start_time TIMESTAMPTZ NOT NULL,
     end_time TIMESTAMPTZ NOT NULL,
     attendees_count INTEGER DEFAULT 0,
-    attendees_emails JSONB DEFAULT '[]'::jsonb,
+    attendees_emails VARCHAR(320)[] DEFAULT '{}',
     location VARCHAR(500),
     is_filtered BOOLEAN DEFAULT FALSE,
     is_selected BOOLEAN DEFAULT FALSE,
@@ -101,11 +104,7 @@ CREATE TABLE IF NOT EXISTS calendar_events (
     updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
     UNIQUE(calendar_connection_id, google_event_id)
 );
-CREATE INDEX IF NOT EXISTS ix_calendar_events_connection_id ON calendar_events(calendar_connection_id);
-CREATE INDEX IF NOT EXISTS ix_calendar_events_google_event_id ON calendar_events(google_event_id);
-CREATE INDEX IF NOT EXISTS ix_calendar_events_start_time ON calendar_events(start_time);
-CREATE INDEX IF NOT EXISTS ix_calendar_events_is_filtered ON calendar_events(is_filtered);
-CREATE INDEX IF NOT EXISTS ix_calendar_events_is_selected ON calendar_events(is_selected);
+CREATE INDEX IF NOT EXISTS ix_calendar_events_conn_start ON calendar_events(calendar_connection_id, start_time);
 
 -- 8. Create Calendar Event Selections Table
 CREATE TABLE IF NOT EXISTS calendar_event_selections (
@@ -118,3 +117,18 @@ CREATE TABLE IF NOT EXISTS calendar_event_selections (
 );
 CREATE INDEX IF NOT EXISTS ix_calendar_event_selections_event_id ON calendar_event_selections(calendar_event_id);
 CREATE INDEX IF NOT EXISTS ix_calendar_event_selections_session_id ON calendar_event_selections(one_on_one_session_id);
+
+-- 9. Create Calendar Sync Jobs Table
+CREATE TABLE IF NOT EXISTS calendar_sync_jobs (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+    error TEXT,
+    synced_count INTEGER DEFAULT 0,
+    filtered_count INTEGER DEFAULT 0,
+    new_count INTEGER DEFAULT 0,
+    updated_count INTEGER DEFAULT 0,
+    created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS ix_calendar_sync_jobs_user_created ON calendar_sync_jobs(user_id, created_at);
@@ -1,9 +1,10 @@
+import asyncio
 from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from server.app.core.database import get_db
-from server.app.domain.oneonone.service import OneOnOneService
+from server.app.domain.oneonone.service import OneOnOneService, run_analysis_job
 from server.app.domain.oneonone.repositories.session_repository import SessionRepository
 from server.app.domain.oneonone.repositories.goal_repository import GoalRepository
 from server.app.formatters.report_formatter import ReportFormatter
@@ -11,13 +12,22 @@ from server.app.domain.oneonone.schemas.session import AnalysisResponse, ReportR
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
-def get_one_on_one_service(db: AsyncSession = Depends(get_db)) -> OneOnOneService:
+# 이벤트 루프는 태스크를 약한 참조로만 들고 있으므로, 분석 잡이 도중에
+# GC로 사라지지 않도록 완료될 때까지 강한 참조를 유지합니다
+_analysis_jobs: set[asyncio.Task] = set()
+
+async def get_one_on_one_service(db: AsyncSession = Depends(get_db)) -> OneOnOneService:
     session_repo = SessionRepository(db)
     goal_repo = GoalRepository(db)
     formatter = ReportFormatter()
     return OneOnOneService(session_repo, goal_repo, formatter)
 
-@router.post("/{session_id}/analyze", response_model=AnalysisResponse)
+@router.post(
+    "/{session_id}/analyze",
+    response_model=AnalysisResponse,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def analyze_session(
     session_id: int,
     file: UploadFile = File(...),
@@ -25,37 +35,47 @@ async def analyze_session(
 ) -> Any:
     """
     1on1 세션 음성 파일을 업로드하고 분석을 시작합니다.
+
+    Whisper STT + LLM 분석은 수십 초가 걸리므로 백그라운드에서 실행되며,
+    진행 상태와 결과는 GET /sessions/{session_id}/report 로 조회합니다.
     """
     try:
-        report_json = await service.analyze_audio(session_id, file)
-        return {
-            "message": "Analysis completed successfully",
-            "session_id": session_id,
-            "status": "completed"
-        }
+        file_path, digest = await service.save_upload(session_id, file)
+        await service.mark_processing(session_id)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except Exception as e:
-        import traceback
-        print(traceback.format_exc())
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Analysis failed: {str(e)}")
 
-@router.get("/{session_id}/report", response_model=ReportResponse)
+    task = asyncio.create_task(run_analysis_job(session_id, file_path, digest))
+    _analysis_jobs.add(task)
+    task.add_done_callback(_analysis_jobs.discard)
+
+    return {
+        "message": "Analysis started",
+        "session_id": session_id,
+        "status": "processing"
+    }
+
+@router.get(
+    "/{session_id}/report",
+    response_model=ReportResponse,
+    response_model_exclude_none=True,
+)
 async def get_session_report(
     session_id: int,
     service: OneOnOneService = Depends(get_one_on_one_service)
 ) -> Any:
     """
     저장된 1on1 분석 리포트를 조회합니다.
+
+    리포트가 아직 없으면 세션 상태(processing/failed 등)만 반환하므로,
+    폴링 클라이언트가 진행 중과 실패를 구분할 수 있습니다.
+    404는 세션 자체가 없을 때만 반환합니다.
     """
-    report = await service.get_report(session_id)
-    if not report:
+    payload = await service.get_report(session_id)
+    if payload is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Report not found for this session. Please analyze first."
+            detail="Session not found"
         )
-    
-    return {
-        "session_id": session_id,
-        "report": report
-    }
+
+    return payload
@@ -3,29 +3,41 @@ Analysis calculators for 1on1 Mirror.
 
 This module provides the core calculation framework and specific analyzers
 for processing meeting data and generating insights.
+
+Exports are resolved lazily (PEP 562) so importing the package does not pull
+in heavy dependencies (anthropic/httpx) for workers that never touch the
+LLM paths.
 """
 
-from server.app.calculators.base import BaseCalculator
-from server.app.calculators.llm_base import LLMBaseCalculator
-from server.app.calculators.speech_analyzer import SpeechAnalyzer, WhisperTranscription, SpeechSegment, SpeechAnalysisResult
-from server.app.calculators.goal_alignment_calculator import GoalAlignmentCalculator, GoalAlignmentInput, GoalAlignmentResult
-from server.app.calculators.coaching_style_calculator import CoachingStyleCalculator, CoachingStyleInput, CoachingStyleResult
-from server.app.calculators.safety_score_calculator import SafetyScoreCalculator, SafetyScoreInput, SafetyScoreResult
+import importlib
+
+# Export name -> defining module
+_EXPORTS = {
+    "BaseCalculator": "server.app.calculators.base",
+    "LLMBaseCalculator": "server.app.calculators.llm_base",
+    "SpeechAnalyzer": "server.app.calculators.speech_analyzer",
+    "WhisperTranscription": "server.app.calculators.speech_analyzer",
+    "SpeechSegment": "server.app.calculators.speech_analyzer",
+    "SpeechAnalysisResult": "server.app.calculators.speech_analyzer",
+    "GoalAlignmentCalculator": "server.app.calculators.goal_alignment_calculator",
+    "GoalAlignmentInput": "server.app.calculators.goal_alignment_calculator",
+    "GoalAlignmentResult": "server.app.calculators.goal_alignment_calculator",
+    "CoachingStyleCalculator": "server.app.calculators.coaching_style_calculator",
+    "CoachingStyleInput": "server.app.calculators.coaching_style_calculator",
+    "CoachingStyleResult": "server.app.calculators.coaching_style_calculator",
+    "SafetyScoreCalculator": "server.app.calculators.safety_score_calculator",
+    "SafetyScoreInput": "server.app.calculators.safety_score_calculator",
+    "SafetyScoreResult": "server.app.calculators.safety_score_calculator",
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    "BaseCalculator",
-    "LLMBaseCalculator",
-    "SpeechAnalyzer",
-    "WhisperTranscription",
-    "SpeechSegment",
-    "SpeechAnalysisResult",
-    "GoalAlignmentCalculator",
-    "GoalAlignmentInput",
-    "GoalAlignmentResult",
-    "CoachingStyleCalculator",
-    "CoachingStyleInput",
-    "CoachingStyleResult",
-    "SafetyScoreCalculator",
-    "SafetyScoreInput",
-    "SafetyScoreResult",
-]
+def __getattr__(name: str):
+    """Resolve exported names on first access and cache them on the module."""
+    module_path = _EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
@@ -2,6 +2,7 @@
 Goal alignment calculator for analyzing topic similarity between goals and conversation.
 """
 
+import asyncio
 import re
 from collections import Counter
 
@@ -9,6 +10,10 @@ from pydantic import BaseModel, Field
 
 from server.app.calculators.base import BaseCalculator
 
+# Word pattern for keyword extraction (Korean: 한글 문자, English: alphabetic
+# characters). Compiled once at import time instead of on every call.
+_WORD_RE = re.compile(r'[가-힣]+|[a-z]+')
+
 
 class GoalAlignmentInput(BaseModel):
     """Input model for goal alignment analysis."""
@@ -117,22 +122,22 @@ class GoalAlignmentCalculator(BaseCalculator[GoalAlignmentInput, GoalAlignmentRe
     MAX_KEYWORDS = 30
     
     # Common stop words (basic Korean and English)
-    STOP_WORDS_KO = {
+    STOP_WORDS_KO = frozenset({
         "이", "그", "저", "것", "수", "등", "들", "및", "에", "을", "를", "이를",
         "위해", "통해", "대한", "있는", "하는", "되는", "같은", "있다", "한다",
         "많은", "다른", "새로운", "그리고", "하지만", "그러나", "또한", "및"
-    }
-    
-    STOP_WORDS_EN = {
+    })
+
+    STOP_WORDS_EN = frozenset({
         "the", "is", "at", "which", "on", "a", "an", "as", "are", "was", "were",
         "be", "been", "being", "have", "has", "had", "do", "does", "did",
         "will", "would", "should", "could", "may", "might", "must", "can",
         "and", "or", "but", "if", "then", "else", "when", "where", "how", "why"
-    }
-    
-    def __init__(self):
-        """Initialize the calculator with language-specific settings."""
-        self.stop_words = self.STOP_WORDS_KO | self.STOP_WORDS_EN
+    })
+
+    # Combined once at class definition; calculators are built per request,
+    # so a per-instance union would reallocate this set on every request.
+    STOP_WORDS = STOP_WORDS_KO | STOP_WORDS_EN
     
     async def calculate(self, data: GoalAlignmentInput) -> GoalAlignmentResult:
         """
@@ -148,29 +153,56 @@ class GoalAlignmentCalculator(BaseCalculator[GoalAlignmentInput, GoalAlignmentRe
             ValueError: If input texts are empty or invalid
         """
         self.validate_input(data)
-        
-        # Extract keywords from both texts
-        goal_keywords = self._extract_keywords(data.goal_text)
-        conversation_keywords = self._extract_keywords(data.conversation_transcript)
-        
+
+        # Lowercase each text exactly once; both keyword extraction and
+        # topic matching work on the same normalized strings, so no method
+        # re-allocates a lowered copy of a long transcript.
+        goal_lower = data.goal_text.lower()
+        conversation_lower = data.conversation_transcript.lower()
+
+        # Extract keywords from both texts in worker threads: regex scanning
+        # of a long transcript is the only CPU-heavy work in this handler,
+        # and re.finditer releases the GIL for long stretches, so the event
+        # loop stays responsive and both extractions overlap.
+        goal_keywords, conversation_keywords = await asyncio.gather(
+            asyncio.to_thread(self._extract_keywords, goal_lower, already_lower=True),
+            asyncio.to_thread(self._extract_keywords, conversation_lower, already_lower=True),
+        )
+
         # Find matched topics
         matched_topics = self._find_matched_topics(
             goal_keywords,
             conversation_keywords,
-            data.goal_text,
-            data.conversation_transcript
+            goal_lower,
+            conversation_lower
         )
-        
-        # Calculate alignment metrics
+
+        # No token overlap at all: skip the scoring math and return the
+        # zeroed result directly (common for off-topic sessions).
+        if not matched_topics:
+            return GoalAlignmentResult(
+                alignment_score=0.0,
+                matched_topics=[],
+                matched_topic_count=0,
+                goal_keywords=goal_keywords,
+                conversation_keywords=conversation_keywords,
+                goal_coverage=0.0,
+                is_aligned=False,
+                alignment_category="none",
+                missing_topics=goal_keywords[:5],
+            )
+
+        # Calculate alignment metrics. Coverage falls out of the matched
+        # topic count, so no second keyword-set intersection is needed.
         alignment_score = self._calculate_alignment_score(matched_topics, goal_keywords)
-        goal_coverage = self._calculate_goal_coverage(goal_keywords, conversation_keywords)
-        
+        goal_coverage = self._calculate_goal_coverage(len(matched_topics), len(goal_keywords))
+
         # Determine alignment category
         alignment_category = self._categorize_alignment(alignment_score)
         is_aligned = alignment_score >= 0.3
-        
-        # Find missing topics
-        missing_topics = self._find_missing_topics(goal_keywords, conversation_keywords)
+
+        # Find missing topics (one set build for O(1) membership checks)
+        missing_topics = self._find_missing_topics(goal_keywords, set(conversation_keywords))
         
         return GoalAlignmentResult(
             alignment_score=alignment_score,
@@ -184,82 +216,73 @@ class GoalAlignmentCalculator(BaseCalculator[GoalAlignmentInput, GoalAlignmentRe
             missing_topics=missing_topics,
         )
     
-    def _extract_keywords(self, text: str) -> list[str]:
+    def _extract_keywords(self, text: str, already_lower: bool = False) -> list[str]:
         """
         Extract important keywords from text.
-        
+
         Args:
             text: Input text to extract keywords from
-            
+            already_lower: Set when the caller has already lowercased text
+
         Returns:
             List of extracted keywords, ordered by importance
         """
         # Normalize text: lowercase and remove special characters
-        normalized = text.lower()
-        
-        # Extract words (handling both Korean and English)
-        # Korean: 한글 문자, English: alphabetic characters
-        words = re.findall(r'[가-힣]+|[a-z]+', normalized)
-        
-        # Filter out stop words and short words
-        filtered_words = [
+        normalized = text if already_lower else text.lower()
+
+        # Stream matches straight into Counter, filtering stop words and
+        # short words inline, so no intermediate word list is materialized.
+        words = (match.group() for match in _WORD_RE.finditer(normalized))
+        word_freq = Counter(
             word for word in words
-            if len(word) >= self.MIN_KEYWORD_LENGTH and word not in self.stop_words
-        ]
-        
-        # Count word frequencies
-        word_freq = Counter(filtered_words)
-        
+            if len(word) >= self.MIN_KEYWORD_LENGTH and word not in self.STOP_WORDS
+        )
+
         # Get top keywords by frequency
         top_keywords = [
             word for word, _ in word_freq.most_common(self.MAX_KEYWORDS)
         ]
-        
+
         return top_keywords
     
     def _find_matched_topics(
         self,
         goal_keywords: list[str],
         conversation_keywords: list[str],
-        goal_text: str,
-        conversation_text: str
+        goal_text_lower: str,
+        conversation_text_lower: str
     ) -> list[TopicMatch]:
         """
         Find topics that appear in both goal and conversation.
-        
+
         Args:
             goal_keywords: Keywords from goal text
             conversation_keywords: Keywords from conversation text
-            goal_text: Original goal text
-            conversation_text: Original conversation text
-            
+            goal_text_lower: Lowercased goal text
+            conversation_text_lower: Lowercased conversation text
+
         Returns:
             List of matched topics with relevance scores
         """
         matched_topics = []
-        
+
+        # Precompute keyword -> position maps once; list.index inside the
+        # loop would rescan each list per keyword (O(n^2) overall).
+        goal_ranks = {keyword: rank for rank, keyword in enumerate(goal_keywords)}
+        conv_ranks = {keyword: rank for rank, keyword in enumerate(conversation_keywords)}
+
         # Find common keywords
-        common_keywords = set(goal_keywords) & set(conversation_keywords)
-        
-        # Calculate frequencies in original texts
-        goal_text_lower = goal_text.lower()
-        conversation_text_lower = conversation_text.lower()
-        
+        common_keywords = goal_ranks.keys() & conv_ranks.keys()
+
         for keyword in common_keywords:
             goal_freq = goal_text_lower.count(keyword)
             conv_freq = conversation_text_lower.count(keyword)
-            
+
             # Calculate relevance score based on:
             # 1. Frequency in both texts
             # 2. Position in keyword lists (earlier = more important)
-            goal_position_score = (
-                1.0 - (goal_keywords.index(keyword) / len(goal_keywords))
-                if keyword in goal_keywords else 0.0
-            )
-            conv_position_score = (
-                1.0 - (conversation_keywords.index(keyword) / len(conversation_keywords))
-                if keyword in conversation_keywords else 0.0
-            )
+            goal_position_score = 1.0 - (goal_ranks[keyword] / len(goal_keywords))
+            conv_position_score = 1.0 - (conv_ranks[keyword] / len(conversation_keywords))
             
             # Combined relevance score (0-1)
             relevance_score = (
@@ -319,24 +342,23 @@ class GoalAlignmentCalculator(BaseCalculator[GoalAlignmentInput, GoalAlignmentRe
     
     def _calculate_goal_coverage(
         self,
-        goal_keywords: list[str],
-        conversation_keywords: list[str]
+        matched_count: int,
+        goal_keyword_count: int
     ) -> float:
         """
         Calculate what percentage of goal keywords were discussed.
-        
+
         Args:
-            goal_keywords: Keywords from goal text
-            conversation_keywords: Keywords from conversation text
-            
+            matched_count: Number of keywords found in both goal and conversation
+            goal_keyword_count: Total number of goal keywords
+
         Returns:
             Coverage ratio between 0 and 1
         """
-        if not goal_keywords:
+        if not goal_keyword_count:
             return 0.0
-        
-        matched_count = len(set(goal_keywords) & set(conversation_keywords))
-        return matched_count / len(goal_keywords)
+
+        return matched_count / goal_keyword_count
     
     def _categorize_alignment(self, alignment_score: float) -> str:
         """
@@ -360,21 +382,21 @@ class GoalAlignmentCalculator(BaseCalculator[GoalAlignmentInput, GoalAlignmentRe
     def _find_missing_topics(
         self,
         goal_keywords: list[str],
-        conversation_keywords: list[str]
+        conversation_keyword_set: set[str]
     ) -> list[str]:
         """
         Find important topics from goal that weren't discussed.
-        
+
         Args:
             goal_keywords: Keywords from goal text
-            conversation_keywords: Keywords from conversation text
-            
+            conversation_keyword_set: Keywords from conversation text
+
         Returns:
             List of missing keywords (top 5 by importance)
         """
         missing = [
             keyword for keyword in goal_keywords
-            if keyword not in conversation_keywords
+            if keyword not in conversation_keyword_set
         ]
         
         # Return top 5 most important (earliest in goal_keywords list)
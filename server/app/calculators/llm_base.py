@@ -2,13 +2,17 @@
 Base class for LLM-based calculators using Claude 3.5 Sonnet.
 """
 
+import asyncio
 import json
+import random
+from functools import lru_cache
 from typing import Type, TypeVar
 
-from anthropic import AsyncAnthropic, APIError
+from anthropic import APIConnectionError, APIError, APIStatusError, AsyncAnthropic, RateLimitError
 from pydantic import BaseModel
 
 from server.app.calculators.base import BaseCalculator
+from server.app.calculators.llm_cache import LLMResponseCache
 from server.app.core.config import settings
 from server.app.core.logging import get_logger
 
@@ -17,83 +21,289 @@ logger = get_logger(__name__)
 TInput = TypeVar("TInput")
 TOutput = TypeVar("TOutput", bound=BaseModel)
 
+# Process-wide response cache shared by all LLM calculators.
+_response_cache = LLMResponseCache(
+    max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+    similarity_threshold=settings.LLM_CACHE_SIMILARITY_THRESHOLD,
+)
+
+# Identical requests issued concurrently (e.g. calculators gathered in one
+# session analysis) share a single in-flight API call instead of each
+# paying for their own round-trip.
+_inflight_calls: dict[str, asyncio.Task] = {}
+
+_TOOL_NAME = "record_analysis_result"
+_TOOL_CHOICE = {"type": "tool", "name": _TOOL_NAME}
+
+# Retry policy for transient Anthropic failures (429/5xx/connection drops)
+_MAX_ATTEMPTS = 5
+_BACKOFF_BASE_SECONDS = 1.0
+_BACKOFF_CAP_SECONDS = 20.0
+
+
+def _is_transient(error: APIError) -> bool:
+    """Whether an API error is worth retrying (rate limit, overload, network)."""
+    if isinstance(error, (RateLimitError, APIConnectionError)):
+        return True
+    return isinstance(error, APIStatusError) and error.status_code >= 500
+
+
+def _retry_wait(attempt: int, error: APIError) -> float:
+    """Seconds to wait before the next attempt; honors retry-after if sent."""
+    response = getattr(error, "response", None)
+    if response is not None:
+        retry_after = response.headers.get("retry-after")
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+    # Full-jitter exponential backoff
+    return random.uniform(0.0, min(_BACKOFF_CAP_SECONDS, _BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+# One AsyncAnthropic client (and thus one warm httpx connection pool) is
+# shared by every calculator instance; FastAPI builds calculators per
+# request, so per-instance clients would redo TLS setup on each request.
+_shared_client: AsyncAnthropic | None = None
+
+
+def get_shared_client() -> AsyncAnthropic:
+    """Return the process-wide Anthropic client, creating it on first use."""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared Anthropic client (called on application shutdown)."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.close()
+        _shared_client = None
+
+
+@lru_cache(maxsize=None)
+def _tool_definition_for(model_cls: type[BaseModel]) -> dict:
+    """
+    Build (once per model class) the Anthropic tool definition for an output model.
+
+    Pydantic schema generation walks the whole model graph, so the result is
+    cached; the SDK does not mutate the dict, so the reference is shared.
+    The cache_control marker enables Anthropic prompt caching of the schema.
+    """
+    return {
+        "name": _TOOL_NAME,
+        "description": "Record the analysis result in the specified structure.",
+        "input_schema": model_cls.model_json_schema(),
+        "cache_control": {"type": "ephemeral"}
+    }
+
 
 class LLMBaseCalculator(BaseCalculator[TInput, TOutput]):
     """
     Abstract base class for calculators that leverage LLM for analysis.
-    
+
     This class handles the initialization of the Anthropic client and provides
     helper methods for generating structured insights using Claude 3.5 Sonnet.
     """
-    
+
     def __init__(self):
-        """Initialize Anthropic client with API key from settings."""
+        """Initialize calculator settings; the API client is built lazily."""
         if not settings.ANTHROPIC_API_KEY:
             logger.warning("ANTHROPIC_API_KEY is not set. LLM features will not work.")
-        
-        self.client = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+
         self.model = "claude-sonnet-4-20250514"  # Latest stable Sonnet version
-        
+
+    @property
+    def client(self) -> AsyncAnthropic:
+        """Process-wide Anthropic client, created on first use so
+        instantiating a calculator does not build an httpx transport."""
+        return get_shared_client()
+
+    async def calculate_batch(
+        self,
+        inputs: list[TInput],
+        max_concurrency: int = 8
+    ) -> list[TOutput]:
+        """
+        Run calculate over many inputs concurrently.
+
+        Wall time becomes roughly one call's latency times
+        ceil(N / max_concurrency) instead of the serial sum; the semaphore
+        keeps the request rate within Anthropic's limits. Duplicate inputs
+        within a batch collapse into one API call via the response cache
+        and in-flight coalescing in _get_llm_insight.
+
+        Args:
+            inputs: Input items, one per calculate() call
+            max_concurrency: Maximum number of API calls in flight at once
+
+        Returns:
+            Results in the same order as inputs
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(item: TInput) -> TOutput:
+            async with semaphore:
+                return await self.calculate(item)
+
+        return list(await asyncio.gather(*(_bounded(item) for item in inputs)))
+
     async def _get_llm_insight(
         self,
         system_prompt: str,
         user_message: str,
-        output_model: Type[TOutput]
+        output_model: Type[TOutput],
+        temperature: float = 0.0
     ) -> TOutput:
         """
         Generate structured insight from LLM.
-        
+
         Uses Claude's Tool Use feature (or JSON embedding) to ensure the output
         matches the Pydantic model structure.
-        
+
         Args:
             system_prompt: Investigated system prompt with definitions
             user_message: The content to analyze
             output_model: Pydantic model class for validation
-            
+            temperature: Sampling temperature; only 0.0 calls are cacheable
+
         Returns:
             Validated instance of output_model
-            
+
         Raises:
             Exception: If API call fails or parsing fails
         """
         if not settings.ANTHROPIC_API_KEY:
             raise ValueError("Anthropic API Key is missing")
 
-        # Construct the tool definition from Pydantic model
-        schema = output_model.model_json_schema()
-        tool_name = "record_analysis_result"
-        
-        tool_definition = {
-            "name": tool_name,
-            "description": "Record the analysis result in the specified structure.",
-            "input_schema": schema
-        }
-        
+        # Caching a sampled (non-deterministic) response would pin one random
+        # draw forever, so only temperature-0 calls go through the cache.
+        if not settings.LLM_CACHE_ENABLED or temperature != 0.0:
+            return await self._request_insight(
+                system_prompt, user_message, output_model, temperature=temperature
+            )
+
+        # Check the response cache before paying for a Claude round-trip
+        exact_key, bucket_key = LLMResponseCache.make_keys(
+            system_prompt, user_message, output_model.__name__
+        )
+        cached = _response_cache.get(exact_key, bucket_key, user_message)
+        if cached is not None:
+            logger.info(f"LLM cache hit for {output_model.__name__}")
+            return output_model.model_validate_json(cached)
+
+        # Coalesce concurrent identical requests into one API call
+        inflight = _inflight_calls.get(exact_key)
+        if inflight is not None:
+            return await inflight
+
+        task = asyncio.ensure_future(
+            self._request_insight(
+                system_prompt, user_message, output_model,
+                exact_key=exact_key, bucket_key=bucket_key,
+            )
+        )
+        _inflight_calls[exact_key] = task
+        try:
+            return await task
+        finally:
+            _inflight_calls.pop(exact_key, None)
+
+    async def _request_insight(
+        self,
+        system_prompt: str,
+        user_message: str,
+        output_model: Type[TOutput],
+        temperature: float = 0.0,
+        exact_key: str | None = None,
+        bucket_key: str | None = None,
+    ) -> TOutput:
+        """
+        Issue the actual Anthropic API call and validate the response.
+
+        Args:
+            system_prompt: Investigated system prompt with definitions
+            user_message: The content to analyze
+            output_model: Pydantic model class for validation
+            temperature: Sampling temperature for the call
+            exact_key: Cache key to store the response under (optional)
+            bucket_key: Semantic cache bucket for the response (optional)
+
+        Returns:
+            Validated instance of output_model
+        """
+        # Tool definition is cached per output model; the static prefix
+        # (tool schema + system prompt) is marked for Anthropic prompt
+        # caching, while the per-call user_message stays uncached so
+        # transcript variation does not invalidate the prefix.
+        tool_definition = _tool_definition_for(output_model)
+
         try:
             logger.info("Calling Claude 3.5 Sonnet API for analysis")
-            response = await self.client.messages.create(
+            response = await self._create_with_retry(
                 model=self.model,
                 max_tokens=4096,
-                temperature=0.0,
-                system=system_prompt,
+                temperature=temperature,
+                system=[
+                    {
+                        "type": "text",
+                        "text": system_prompt,
+                        "cache_control": {"type": "ephemeral"}
+                    }
+                ],
                 messages=[
                     {"role": "user", "content": user_message}
                 ],
                 tools=[tool_definition],
-                tool_choice={"type": "tool", "name": tool_name}
+                tool_choice=_TOOL_CHOICE
             )
-            
+
+            # Surface prompt-cache effectiveness (tool schema + system
+            # prompt are marked ephemeral, so repeat calls should report
+            # nonzero cache_read_input_tokens here).
+            cache_read = getattr(response.usage, "cache_read_input_tokens", None)
+            if cache_read:
+                logger.debug(f"Anthropic prompt cache read {cache_read} input tokens")
+
             # Extract tool use content
             for content in response.content:
-                if content.type == "tool_use" and content.name == tool_name:
-                    return output_model.model_validate(content.input)
-            
+                if content.type == "tool_use" and content.name == _TOOL_NAME:
+                    result = output_model.model_validate(content.input)
+                    if exact_key is not None:
+                        _response_cache.put(
+                            exact_key, bucket_key, user_message, result.model_dump_json()
+                        )
+                    return result
+
             raise ValueError("LLM did not return a valid tool use response")
-            
+
         except APIError as e:
             logger.error(f"Anthropic API Error: {str(e)}")
             raise
         except Exception as e:
             logger.error(f"Failed to process LLM response: {str(e)}")
             raise
+
+    async def _create_with_retry(self, **create_kwargs):
+        """
+        Call messages.create, retrying transient failures with backoff.
+
+        Rate limits, overload responses (5xx), and connection drops are
+        retried up to _MAX_ATTEMPTS times with full-jitter exponential
+        backoff; validation errors (4xx) surface immediately.
+        """
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                return await self.client.messages.create(**create_kwargs)
+            except APIError as e:
+                if attempt == _MAX_ATTEMPTS - 1 or not _is_transient(e):
+                    raise
+                wait = _retry_wait(attempt, e)
+                logger.warning(
+                    f"Transient Anthropic error ({type(e).__name__}), "
+                    f"retrying in {wait:.1f}s (attempt {attempt + 1}/{_MAX_ATTEMPTS})"
+                )
+                await asyncio.sleep(wait)
@@ -0,0 +1,186 @@
+"""
+In-process response cache for LLM-based calculators.
+
+Caching an LLM response avoids a full Claude round-trip (seconds of latency
+and paid tokens) when the same or a near-identical prompt has already been
+analyzed. Two tiers are used:
+
+1. Exact tier: SHA-256 of (system_prompt, user_message, output schema)
+   mapped to the serialized Pydantic JSON of the previous response.
+2. Semantic tier: a bag-of-words vector of the user message, bucketed per
+   (system_prompt, output model). A new request whose cosine similarity to
+   a cached message meets the configured threshold reuses that response.
+
+Entries expire after a TTL and are evicted LRU-first once the cache is full.
+"""
+
+import hashlib
+import math
+import re
+import time
+from collections import Counter, OrderedDict
+
+
+# Word pattern shared with the keyword-based calculators (Korean + English).
+_TOKEN_RE = re.compile(r"[가-힣]+|[a-z0-9]+")
+
+
+def _vectorize(text: str) -> Counter:
+    """Build a bag-of-words frequency vector for similarity comparison."""
+    return Counter(_TOKEN_RE.findall(text.lower()))
+
+
+def _cosine_similarity(a: Counter, b: Counter) -> float:
+    """Compute cosine similarity between two bag-of-words vectors."""
+    if not a or not b:
+        return 0.0
+
+    # Iterate over the smaller vector for the dot product
+    if len(a) > len(b):
+        a, b = b, a
+
+    dot = sum(count * b[token] for token, count in a.items())
+    if dot == 0:
+        return 0.0
+
+    norm_a = math.sqrt(sum(count * count for count in a.values()))
+    norm_b = math.sqrt(sum(count * count for count in b.values()))
+    return dot / (norm_a * norm_b)
+
+
+class LLMResponseCache:
+    """
+    Two-tier (exact + semantic) LRU cache for serialized LLM responses.
+
+    Values are stored as JSON strings (the serialized Pydantic response)
+    so cached entries can be revalidated into fresh model instances on hit.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: float = 3600.0,
+        similarity_threshold: float = 0.95,
+    ):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached responses (LRU eviction)
+            ttl_seconds: Time-to-live for each entry in seconds
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+
+        # exact key -> (expires_at, response_json)
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        # bucket key -> list of (exact_key, user_message_vector)
+        self._buckets: dict[str, list[tuple[str, Counter]]] = {}
+
+    @staticmethod
+    def make_keys(system_prompt: str, user_message: str, schema_key: str) -> tuple[str, str]:
+        """
+        Build the exact-match key and the semantic bucket key for a request.
+
+        Args:
+            system_prompt: The calculator's system prompt
+            user_message: The content being analyzed
+            schema_key: A stable identifier of the output schema
+
+        Returns:
+            Tuple of (exact_key, bucket_key)
+        """
+        bucket_key = hashlib.sha256(
+            f"{system_prompt}\x00{schema_key}".encode()
+        ).hexdigest()
+        exact_key = hashlib.sha256(
+            f"{bucket_key}\x00{user_message}".encode()
+        ).hexdigest()
+        return exact_key, bucket_key
+
+    def get(self, exact_key: str, bucket_key: str, user_message: str) -> str | None:
+        """
+        Look up a cached response, trying the exact tier then the semantic tier.
+
+        Args:
+            exact_key: Exact-match key from make_keys
+            bucket_key: Semantic bucket key from make_keys
+            user_message: The content being analyzed (for similarity matching)
+
+        Returns:
+            The cached response JSON, or None on miss
+        """
+        cached = self._get_exact(exact_key)
+        if cached is not None:
+            return cached
+
+        bucket = self._buckets.get(bucket_key)
+        if not bucket:
+            return None
+
+        query_vector = _vectorize(user_message)
+        best_key = None
+        best_similarity = 0.0
+        for candidate_key, candidate_vector in bucket:
+            similarity = _cosine_similarity(query_vector, candidate_vector)
+            if similarity > best_similarity:
+                best_similarity = similarity
+                best_key = candidate_key
+
+        if best_key is not None and best_similarity >= self.similarity_threshold:
+            return self._get_exact(best_key)
+
+        return None
+
+    def put(self, exact_key: str, bucket_key: str, user_message: str, response_json: str) -> None:
+        """
+        Insert a response into both cache tiers.
+
+        Args:
+            exact_key: Exact-match key from make_keys
+            bucket_key: Semantic bucket key from make_keys
+            user_message: The content that was analyzed
+            response_json: Serialized Pydantic response to cache
+        """
+        if exact_key in self._entries:
+            # Same exact_key means the same message: the bucket already
+            # holds its vector, so only the TTL needs refreshing.
+            self._entries.move_to_end(exact_key)
+        else:
+            if len(self._entries) >= self.max_entries:
+                self._evict_one()
+            self._buckets.setdefault(bucket_key, []).append(
+                (exact_key, _vectorize(user_message))
+            )
+
+        self._entries[exact_key] = (time.monotonic() + self.ttl_seconds, response_json)
+
+    def _get_exact(self, exact_key: str) -> str | None:
+        """Return a live exact-tier entry, dropping it if expired."""
+        entry = self._entries.get(exact_key)
+        if entry is None:
+            return None
+
+        expires_at, response_json = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[exact_key]
+            self._prune_buckets(exact_key)
+            return None
+
+        self._entries.move_to_end(exact_key)
+        return response_json
+
+    def _evict_one(self) -> None:
+        """Evict the least-recently-used entry and its semantic references."""
+        evicted_key, _ = self._entries.popitem(last=False)
+        self._prune_buckets(evicted_key)
+
+    def _prune_buckets(self, exact_key: str) -> None:
+        """Drop semantic-tier references to a removed exact entry."""
+        for bucket_key in list(self._buckets):
+            bucket = self._buckets[bucket_key]
+            bucket[:] = [(key, vec) for key, vec in bucket if key != exact_key]
+            if not bucket:
+                del self._buckets[bucket_key]
@@ -2,7 +2,7 @@
 Calculator for analyzing Psychological Safety score using LLM.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from server.app.calculators.llm_base import LLMBaseCalculator
 
@@ -14,6 +14,11 @@ class SafetyScoreInput(BaseModel):
 
 class SafetyIndicator(BaseModel):
     """An indicator of psychological safety (positive or negative)."""
+
+    # Results carry many indicator instances; frozen keeps them hashable
+    # and skips the mutable-state bookkeeping per instance.
+    model_config = ConfigDict(frozen=True)
+
     category: str = Field(..., description="Category (e.g., 'Empathy', 'Blame', 'Listening')")
     description: str = Field(..., description="Description of the observation")
     quote: str | None = Field(None, description="Relevant quote from transcript if applicable")
@@ -2,22 +2,28 @@
 Speech analyzer calculator for analyzing conversation dynamics from Whisper transcriptions.
 """
 
-from pydantic import BaseModel, Field
+from functools import cached_property
+
+from pydantic import BaseModel, ConfigDict, Field
 
 from server.app.calculators.base import BaseCalculator
 
 
 class SpeechSegment(BaseModel):
     """A single speech segment from Whisper transcription."""
-    
+
+    # Meetings produce thousands of instances, so keep them immutable and
+    # reject unknown keys (no __pydantic_extra__ dict per instance).
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     speaker: str = Field(..., description="Speaker identifier (e.g., 'manager' or 'member')")
     text: str = Field(..., description="Transcribed text content")
     start_time: float = Field(..., description="Segment start time in seconds")
     end_time: float = Field(..., description="Segment end time in seconds")
     
-    @property
+    @cached_property
     def duration(self) -> float:
-        """Calculate the duration of this segment in seconds."""
+        """Duration of this segment in seconds (computed once, then cached)."""
         return self.end_time - self.start_time
 
 
@@ -107,6 +113,44 @@ class SpeechAnalysisResult(BaseModel):
     )
 
 
+def _speech_reduce(
+    starts: list[float], ends: list[float], is_manager: list[bool]
+) -> tuple[float, float, int, float]:
+    """
+    Accumulate all speech metrics in one tight loop over raw arrays.
+
+    Touches only floats and bools (no Pydantic objects, no method dispatch)
+    so the whole reduction is a single interpreter loop over local names.
+
+    Args:
+        starts: Segment start times sorted chronologically
+        ends: Segment end times aligned with starts
+        is_manager: Per-segment flag, True when the manager is speaking
+
+    Returns:
+        Tuple of (manager_time, member_time, manager_turns, silence_time)
+    """
+    manager_time = 0.0
+    member_time = 0.0
+    manager_turns = 0
+    silence = 0.0
+    prev_end = None
+
+    for start, end, mgr in zip(starts, ends, is_manager):
+        if mgr:
+            manager_time += end - start
+            manager_turns += 1
+        else:
+            member_time += end - start
+
+        # Only count positive gaps as silence (ignore overlaps)
+        if prev_end is not None and start > prev_end:
+            silence += start - prev_end
+        prev_end = end
+
+    return manager_time, member_time, manager_turns, silence
+
+
 class SpeechAnalyzer(BaseCalculator[WhisperTranscription, SpeechAnalysisResult]):
     """
     Analyzes speech patterns from Whisper transcription data.
@@ -131,41 +175,73 @@ class SpeechAnalyzer(BaseCalculator[WhisperTranscription, SpeechAnalysisResult])
         Raises:
             ValueError: If segments are invalid or empty
         """
-        self.validate_input(data)
-        
         if not data.segments:
-            raise ValueError("Cannot analyze empty transcription")
-        
-        # Sort segments by start time to ensure chronological order
-        sorted_segments = sorted(data.segments, key=lambda s: s.start_time)
-        
-        # Calculate speaking times and turn counts
-        manager_time = 0.0
-        member_time = 0.0
-        manager_turns = 0
-        member_turns = 0
-        
-        for segment in sorted_segments:
-            duration = segment.duration
-            
-            if segment.speaker == data.manager_identifier:
-                manager_time += duration
-                manager_turns += 1
-            elif segment.speaker == data.member_identifier:
-                member_time += duration
-                member_turns += 1
-        
+            raise ValueError("Segments list cannot be empty")
+
+        manager_id = data.manager_identifier
+        member_id = data.member_identifier
+
+        # Single fused pass: validate each segment, extract the
+        # struct-of-arrays view, and detect whether the input is already
+        # chronological (Whisper emits segments in order, so the sort below
+        # is almost always skipped).
+        starts: list[float] = []
+        ends: list[float] = []
+        is_manager: list[bool] = []
+        sorted_input = True
+        prev_start = float("-inf")
+
+        for i, segment in enumerate(data.segments):
+            start = segment.start_time
+            end = segment.end_time
+            speaker = segment.speaker
+
+            if start < 0:
+                raise ValueError(f"Segment {i} has negative start_time: {start}")
+
+            if end < start:
+                raise ValueError(
+                    f"Segment {i} has end_time ({end}) before start_time ({start})"
+                )
+
+            if speaker == manager_id:
+                is_manager.append(True)
+            elif speaker == member_id:
+                is_manager.append(False)
+            else:
+                raise ValueError(
+                    f"Segment {i} has invalid speaker '{speaker}'. "
+                    f"Expected '{manager_id}' or '{member_id}'"
+                )
+
+            if start < prev_start:
+                sorted_input = False
+            prev_start = start
+
+            starts.append(start)
+            ends.append(end)
+
+        # Sort by start time only when needed (index sort keeps the three
+        # arrays aligned without touching the segment objects)
+        if not sorted_input:
+            order = sorted(range(len(starts)), key=starts.__getitem__)
+            starts = [starts[i] for i in order]
+            ends = [ends[i] for i in order]
+            is_manager = [is_manager[i] for i in order]
+
+        # Speaking times, turn counts, and silence in one fused reduction
+        manager_time, member_time, manager_turns, total_silence_time = _speech_reduce(
+            starts, ends, is_manager
+        )
+        member_turns = len(is_manager) - manager_turns
         total_speaking_time = manager_time + member_time
-        
-        # Calculate silence time
-        total_silence_time = self._calculate_silence_time(sorted_segments)
-        
+
         # Determine meeting duration
         if data.total_duration:
             meeting_duration = data.total_duration
         else:
             # Use the last segment's end time as meeting duration
-            meeting_duration = sorted_segments[-1].end_time if sorted_segments else 0.0
+            meeting_duration = ends[-1]
         
         # Calculate percentages and ratios
         silence_percentage = (
@@ -203,32 +279,6 @@ class SpeechAnalyzer(BaseCalculator[WhisperTranscription, SpeechAnalysisResult])
             meeting_duration=meeting_duration,
         )
     
-    def _calculate_silence_time(self, sorted_segments: list[SpeechSegment]) -> float:
-        """
-        Calculate total silence time between speech segments.
-        
-        Args:
-            sorted_segments: List of segments sorted by start_time
-            
-        Returns:
-            Total silence time in seconds
-        """
-        if len(sorted_segments) < 2:
-            return 0.0
-        
-        total_silence = 0.0
-        
-        for i in range(len(sorted_segments) - 1):
-            current_end = sorted_segments[i].end_time
-            next_start = sorted_segments[i + 1].start_time
-            
-            # Only count positive gaps as silence (ignore overlaps)
-            gap = next_start - current_end
-            if gap > 0:
-                total_silence += gap
-        
-        return total_silence
-    
     def validate_input(self, data: WhisperTranscription) -> None:
         """
         Validate the input transcription data.
@@ -0,0 +1,83 @@
+"""
+Test suite for the LLM response cache used by LLM-based calculators.
+"""
+
+from server.app.calculators.llm_cache import LLMResponseCache
+
+
+SYSTEM_PROMPT = "You are an expert in Organizational Psychology."
+TRANSCRIPT = (
+    "Manager: 이번 프로젝트 지연된 이유가 뭐죠? "
+    "Member: 기술적인 이슈가 좀 생겨서 일정이 밀렸습니다."
+)
+
+
+def test_exact_hit():
+    """A byte-identical request should hit the exact tier."""
+    cache = LLMResponseCache()
+    exact_key, bucket_key = cache.make_keys(SYSTEM_PROMPT, TRANSCRIPT, "SafetyScoreResult")
+
+    assert cache.get(exact_key, bucket_key, TRANSCRIPT) is None
+
+    cache.put(exact_key, bucket_key, TRANSCRIPT, '{"safety_score": 42}')
+    assert cache.get(exact_key, bucket_key, TRANSCRIPT) == '{"safety_score": 42}'
+
+
+def test_semantic_hit_on_near_identical_message():
+    """A lightly paraphrased request should hit the semantic tier."""
+    cache = LLMResponseCache(similarity_threshold=0.9)
+    exact_key, bucket_key = cache.make_keys(SYSTEM_PROMPT, TRANSCRIPT, "SafetyScoreResult")
+    cache.put(exact_key, bucket_key, TRANSCRIPT, '{"safety_score": 42}')
+
+    paraphrased = TRANSCRIPT + " 네."
+    other_key, _ = cache.make_keys(SYSTEM_PROMPT, paraphrased, "SafetyScoreResult")
+    assert other_key != exact_key
+    assert cache.get(other_key, bucket_key, paraphrased) == '{"safety_score": 42}'
+
+
+def test_no_hit_across_buckets():
+    """Different prompts or output models must never share responses."""
+    cache = LLMResponseCache()
+    exact_key, bucket_key = cache.make_keys(SYSTEM_PROMPT, TRANSCRIPT, "SafetyScoreResult")
+    cache.put(exact_key, bucket_key, TRANSCRIPT, '{"safety_score": 42}')
+
+    other_exact, other_bucket = cache.make_keys(SYSTEM_PROMPT, TRANSCRIPT, "CoachingStyleResult")
+    assert cache.get(other_exact, other_bucket, TRANSCRIPT) is None
+
+
+def test_lru_eviction():
+    """The oldest entry is evicted once max_entries is exceeded."""
+    cache = LLMResponseCache(max_entries=2)
+    keys = []
+    for i in range(3):
+        message = f"{TRANSCRIPT} #{i}"
+        exact_key, bucket_key = cache.make_keys(SYSTEM_PROMPT, message, "SafetyScoreResult")
+        cache.put(exact_key, bucket_key, message, f'{{"safety_score": {i}}}')
+        keys.append((exact_key, bucket_key, message))
+
+    evicted_key, evicted_bucket, evicted_message = keys[0]
+    assert cache.get(evicted_key, evicted_bucket, evicted_message) is None
+
+    kept_key, kept_bucket, kept_message = keys[2]
+    assert cache.get(kept_key, kept_bucket, kept_message) == '{"safety_score": 2}'
+
+
+def test_ttl_expiry_prunes_semantic_tier():
+    """An expired entry must leave no stale vector in the semantic tier."""
+    cache = LLMResponseCache(ttl_seconds=0.0)
+    exact_key, bucket_key = cache.make_keys(SYSTEM_PROMPT, TRANSCRIPT, "SafetyScoreResult")
+    cache.put(exact_key, bucket_key, TRANSCRIPT, '{"safety_score": 42}')
+
+    assert cache.get(exact_key, bucket_key, TRANSCRIPT) is None
+    assert cache._buckets == {}
+
+
+def test_re_put_does_not_duplicate_bucket_entry():
+    """Re-caching the same request must not grow its semantic bucket."""
+    cache = LLMResponseCache()
+    exact_key, bucket_key = cache.make_keys(SYSTEM_PROMPT, TRANSCRIPT, "SafetyScoreResult")
+    cache.put(exact_key, bucket_key, TRANSCRIPT, '{"safety_score": 42}')
+    cache.put(exact_key, bucket_key, TRANSCRIPT, '{"safety_score": 43}')
+
+    assert len(cache._buckets[bucket_key]) == 1
+    assert cache.get(exact_key, bucket_key, TRANSCRIPT) == '{"safety_score": 43}'
@@ -104,10 +104,12 @@ async def test_safety_score():
 
 
 async def main():
-    """Run all tests."""
+    """Run all tests concurrently (both analyze the same transcript)."""
     print("\n⚠️ NOTE: Ensure ANTHROPIC_API_KEY is set in .env for these tests to work.\n")
-    await test_coaching_style()
-    await test_safety_score()
+    # The two calculators are independent API calls, so overlapping them
+    # roughly halves wall time; the shared system/tool prefix also warms
+    # Anthropic's prompt cache for the second call.
+    await asyncio.gather(test_coaching_style(), test_safety_score())
 
 
 if __name__ == "__main__":
@@ -91,13 +91,25 @@ class Settings(BaseSettings):
         description="SQLAlchemy SQL 로깅 활성화"
     )
     DB_POOL_SIZE: int = Field(
-        default=5,
+        default=20,
         description="데이터베이스 커넥션 풀 크기"
     )
     DB_MAX_OVERFLOW: int = Field(
-        default=10,
+        default=40,
         description="데이터베이스 커넥션 풀 최대 오버플로우"
     )
+    DB_POOL_RECYCLE_SECONDS: int = Field(
+        default=3600,
+        description="커넥션 재생성 주기 (초) — 유휴 연결의 서버측 타임아웃 방지"
+    )
+    DB_POOL_TIMEOUT_SECONDS: int = Field(
+        default=10,
+        description="풀에서 커넥션을 기다리는 최대 시간 (초)"
+    )
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = Field(
+        default=500,
+        description="asyncpg prepared statement 캐시 크기 (커넥션당)"
+    )
 
     @field_validator("DATABASE_URL", mode="before")
     @classmethod
@@ -160,6 +172,10 @@ class Settings(BaseSettings):
         default="http://localhost:8000/api/v1/calendar/webhook",
         description="구글 캘린더 Webhook URL"
     )
+    TOKEN_REFRESH_BUFFER_SECONDS: int = Field(
+        default=900,
+        description="만료까지 이 시간(초) 이내로 남은 구글 토큰을 선제 갱신"
+    )
 
     # ====================
     # Logging Settings
@@ -180,6 +196,27 @@ class Settings(BaseSettings):
         default="",
         description="OpenAI API 키 (Whisper STT용)"
     )
+    WHISPER_MODEL: str = Field(
+        default="whisper-1",
+        description="STT에 사용할 OpenAI 음성 인식 모델"
+    )
+
+    LLM_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="LLM 응답 캐시 활성화 여부"
+    )
+    LLM_CACHE_TTL_SECONDS: int = Field(
+        default=3600,
+        description="LLM 응답 캐시 TTL (초)"
+    )
+    LLM_CACHE_MAX_ENTRIES: int = Field(
+        default=256,
+        description="LLM 응답 캐시 최대 엔트리 수"
+    )
+    LLM_CACHE_SIMILARITY_THRESHOLD: float = Field(
+        default=0.95,
+        description="LLM 캐시 시맨틱 매칭 유사도 임계값 (0-1)"
+    )
 
     # ====================
     # Domain Plugin Settings
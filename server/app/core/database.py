@@ -5,7 +5,7 @@ SQLAlchemy 2.0 + asyncpg 기반 비동기 데이터베이스 연결
 
 from typing import AsyncGenerator
 
-from sqlalchemy import MetaData
+from sqlalchemy import MetaData, text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -24,7 +24,15 @@ engine = create_async_engine(
     echo=settings.DB_ECHO,
     pool_size=settings.DB_POOL_SIZE,
     max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,  # 유휴 연결 주기적 재생성
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
     pool_pre_ping=True,  # 연결 유효성 자동 검사
+    # 반복 실행되는 쿼리의 파싱/플래닝을 커넥션 수준에서 재사용 (asyncpg)
+    connect_args={
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        # 단건 조회 위주 워크로드에서는 JIT 컴파일 오버헤드가 이득보다 큼
+        "server_settings": {"jit": "off"},
+    },
 )
 
 # ====================
@@ -120,6 +128,28 @@ class DatabaseManager:
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
 
+    @staticmethod
+    async def ensure_tables() -> None:
+        """
+        스키마가 없을 때만 테이블을 생성합니다.
+
+        create_tables()는 스키마가 이미 있어도 metadata의 테이블·인덱스마다
+        존재 확인 DDL을 내보내 카탈로그 왕복이 수십 번 발생합니다. 핵심
+        테이블 하나를 to_regclass로 먼저 확인해(왕복 1회) 이미 있으면 DDL
+        전체를 건너뜁니다. PostgreSQL이 아닌 경우(테스트용 SQLite 등)는
+        그대로 create_tables()로 위임합니다.
+        """
+        if engine.dialect.name == "postgresql":
+            async with engine.connect() as conn:
+                exists = (
+                    await conn.execute(
+                        text("SELECT to_regclass('public.companies')")
+                    )
+                ).scalar()
+            if exists is not None:
+                return
+        await DatabaseManager.create_tables()
+
     @staticmethod
     async def drop_tables() -> None:
         """
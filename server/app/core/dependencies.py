@@ -4,7 +4,9 @@ FastAPI 공통 의존성 (Dependencies)
 라우터에서 사용할 수 있는 재사용 가능한 의존성 함수들을 정의합니다.
 """
 
-from typing import Optional
+import hashlib
+import time
+from typing import NamedTuple, Optional
 
 from fastapi import Depends, Header, HTTPException, status
 from sqlalchemy import select
@@ -16,6 +18,123 @@ from server.app.core.security import verify_token
 from server.app.domain.user.models.user import User
 
 
+# ====================
+# Token Verification Cache
+# ====================
+
+# JWT 서명 검증은 요청마다 반복되는 순수 CPU 작업이므로, 검증에 성공한
+# 토큰의 user_id를 짧은 TTL 동안 캐시하여 핫 패스에서 디코딩을 생략합니다.
+# ORM User 객체는 세션에 묶여 있어 캐시하지 않습니다 — DB 조회는 요청별
+# 세션에서 수행합니다.
+_TOKEN_CACHE_TTL_SECONDS = 60
+_TOKEN_CACHE_MAX_ENTRIES = 50_000
+
+# 토큰 해시 → (캐시 만료 시각(monotonic), user_id, email)
+_token_cache: dict[bytes, tuple[float, int, Optional[str]]] = {}
+
+
+class UserIdentity(NamedTuple):
+    """JWT 클레임만으로 구성한 경량 사용자 식별 정보 (ORM 로딩 없음)"""
+
+    id: int
+    email: Optional[str]
+
+
+def _token_cache_key(token: str) -> bytes:
+    """토큰 원문 대신 저장할 짧은 해시 키를 생성합니다."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _get_cached_identity(token: str) -> Optional[UserIdentity]:
+    """캐시된 검증 결과를 조회합니다. 만료되었으면 제거하고 None을 반환합니다."""
+    entry = _token_cache.get(_token_cache_key(token))
+    if entry is None:
+        return None
+
+    expires_at, user_id, email = entry
+    if time.monotonic() >= expires_at:
+        _token_cache.pop(_token_cache_key(token), None)
+        return None
+
+    return UserIdentity(id=user_id, email=email)
+
+
+def _cache_verified_token(
+    token: str, identity: UserIdentity, token_exp: Optional[float]
+) -> None:
+    """검증에 성공한 토큰을 캐시합니다. TTL은 토큰 잔여 수명을 넘지 않습니다."""
+    ttl = float(_TOKEN_CACHE_TTL_SECONDS)
+    if token_exp is not None:
+        remaining = token_exp - time.time()
+        if remaining <= 0:
+            return
+        ttl = min(ttl, remaining)
+
+    # 캐시가 가득 차면 통째로 비웁니다 — TTL이 짧아 단순한 정책으로 충분합니다.
+    if len(_token_cache) >= _TOKEN_CACHE_MAX_ENTRIES:
+        _token_cache.clear()
+
+    _token_cache[_token_cache_key(token)] = (
+        time.monotonic() + ttl,
+        identity.id,
+        identity.email,
+    )
+
+
+def _parse_bearer_token(authorization: Optional[str]) -> str:
+    """Authorization 헤더에서 Bearer 토큰을 추출합니다."""
+    if not authorization:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authorization header missing",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    try:
+        scheme, token = authorization.split()
+        if scheme.lower() != "bearer":
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid authentication scheme",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authorization header format",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return token
+
+
+def _verify_access_token(token: str) -> UserIdentity:
+    """액세스 토큰을 검증(캐시 우선)하고 JWT 클레임 기반 식별 정보를 반환합니다."""
+    cached = _get_cached_identity(token)
+    if cached is not None:
+        return cached
+
+    payload = verify_token(token, token_type="access")
+    if not payload:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    user_id = payload.get("user_id")
+    if not user_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token payload",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    identity = UserIdentity(id=user_id, email=payload.get("email"))
+    _cache_verified_token(token, identity, payload.get("exp"))
+    return identity
+
+
 # ====================
 # Database Dependency
 # ====================
@@ -39,121 +158,109 @@ async def get_database_session() -> AsyncSession:
 # ====================
 
 
-class AuthenticationChecker:
+async def verify_bearer_token(
+    authorization: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_database_session),
+) -> User:
     """
-    인증 검증 클래스
+    JWT 토큰을 검증하고 사용자 정보를 반환합니다.
+
+    모듈 레벨 함수로 두어 FastAPI가 바운드 메서드 시그니처를 요청마다
+    검사하지 않고, 동일 요청 내 의존성 캐싱 키도 단순해집니다.
+
+    Args:
+        authorization: Authorization 헤더 (Bearer {token})
+        db: 데이터베이스 세션
+
+    Returns:
+        User: 검증된 사용자 객체
 
-    JWT 토큰 검증, API 키 검증 등의 인증 로직을 구현합니다.
+    Raises:
+        HTTPException: 토큰이 유효하지 않은 경우
     """
+    # Bearer 토큰 파싱 + JWT 검증 (최근 검증된 토큰은 캐시에서 바로 처리)
+    token = _parse_bearer_token(authorization)
+    identity = _verify_access_token(token)
 
-    async def verify_token(
-        self,
-        authorization: Optional[str] = Header(None),
-        db: AsyncSession = Depends(get_database_session)
-    ) -> User:
-        """
-        JWT 토큰을 검증하고 사용자 정보를 반환합니다.
+    # 데이터베이스에서 사용자 조회 (identity map에 이미 로드된 경우 SELECT 생략)
+    user = await db.get(User, identity.id)
 
-        Args:
-            authorization: Authorization 헤더 (Bearer {token})
-            db: 데이터베이스 세션
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
-        Returns:
-            User: 검증된 사용자 객체
+    return user
 
-        Raises:
-            HTTPException: 토큰이 유효하지 않은 경우
-        """
-        if not authorization:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Authorization header missing",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
 
-        # Bearer 토큰 파싱
-        try:
-            scheme, token = authorization.split()
-            if scheme.lower() != "bearer":
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid authentication scheme",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authorization header format",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+async def verify_bearer_token_identity(
+    authorization: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_database_session),
+) -> UserIdentity:
+    """
+    JWT 토큰을 검증하고 경량 식별 정보만 반환합니다.
 
-        # JWT 토큰 검증
-        payload = verify_token(token, token_type="access")
-        if not payload:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid or expired token",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+    user.id/email만 필요한 엔드포인트용 — 전체 User 로우를 ORM으로
+    구체화하는 대신 존재 여부만 단일 컬럼 SELECT로 확인합니다.
 
-        # 사용자 ID 추출
-        user_id = payload.get("user_id")
-        if not user_id:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token payload",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+    Args:
+        authorization: Authorization 헤더 (Bearer {token})
+        db: 데이터베이스 세션
 
-        # 데이터베이스에서 사용자 조회
-        result = await db.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
+    Returns:
+        UserIdentity: JWT 클레임 기반 사용자 식별 정보
 
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+    Raises:
+        HTTPException: 토큰이 유효하지 않거나 사용자가 없는 경우
+    """
+    token = _parse_bearer_token(authorization)
+    identity = _verify_access_token(token)
 
-        return user
+    exists = await db.scalar(select(1).where(User.id == identity.id))
+    if not exists:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
-    async def verify_api_key(self, x_api_key: Optional[str] = Header(None)) -> dict:
-        """
-        API 키를 검증합니다.
+    return identity
 
-        Args:
-            x_api_key: X-API-Key 헤더
 
-        Returns:
-            dict: 검증된 클라이언트 정보
+async def verify_api_key(x_api_key: Optional[str] = Header(None)) -> dict:
+    """
+    API 키를 검증합니다.
 
-        Raises:
-            HTTPException: API 키가 유효하지 않은 경우
+    Args:
+        x_api_key: X-API-Key 헤더
 
-        TODO: 실제 API 키 검증 로직 구현
-            - API 키 형식 검증
-            - 데이터베이스에서 키 조회
-            - 키 만료 확인
-            - 사용량 제한 확인
-        """
-        if not x_api_key:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="API key missing",
-            )
+    Returns:
+        dict: 검증된 클라이언트 정보
 
-        # TODO: API 키 검증 로직
-        # api_key_info = await verify_api_key_in_db(x_api_key)
-        # if not api_key_info:
-        #     raise HTTPException(...)
+    Raises:
+        HTTPException: API 키가 유효하지 않은 경우
 
-        # 스텁: 임시 클라이언트 정보 반환
-        return {"client_id": "test_client", "api_key": x_api_key}
+    TODO: 실제 API 키 검증 로직 구현
+        - API 키 형식 검증
+        - 데이터베이스에서 키 조회
+        - 키 만료 확인
+        - 사용량 제한 확인
+    """
+    if not x_api_key:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="API key missing",
+        )
 
+    # TODO: API 키 검증 로직
+    # api_key_info = await verify_api_key_in_db(x_api_key)
+    # if not api_key_info:
+    #     raise HTTPException(...)
 
-# 전역 인증 체커 인스턴스
-auth_checker = AuthenticationChecker()
+    # 스텁: 임시 클라이언트 정보 반환
+    return {"client_id": "test_client", "api_key": x_api_key}
 
 
 # ====================
@@ -162,7 +269,7 @@ auth_checker = AuthenticationChecker()
 
 
 async def get_current_user(
-    user: User = Depends(auth_checker.verify_token),
+    user: User = Depends(verify_bearer_token),
 ) -> User:
     """
     현재 인증된 사용자 정보를 반환합니다.
@@ -209,7 +316,33 @@ async def get_optional_current_user(
         return None
 
     try:
-        return await auth_checker.verify_token(authorization, db)
+        return await verify_bearer_token(authorization, db)
+    except HTTPException:
+        return None
+
+
+async def get_optional_identity(
+    authorization: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_database_session),
+) -> Optional[UserIdentity]:
+    """
+    선택적 인증 (경량 버전): 토큰이 있으면 식별 정보만, 없으면 None 반환
+
+    user.id/email 정도만 필요한 경로(로깅, 요청 컨텍스트 등)에서
+    전체 User 로우를 구체화하지 않고 쓰는 변형입니다.
+
+    Args:
+        authorization: Authorization 헤더
+        db: 데이터베이스 세션
+
+    Returns:
+        Optional[UserIdentity]: 사용자 식별 정보 또는 None
+    """
+    if not authorization:
+        return None
+
+    try:
+        return await verify_bearer_token_identity(authorization, db)
     except HTTPException:
         return None
 
@@ -296,33 +429,58 @@ class RequestContext:
 
 
 async def get_request_context(
-    user: Optional[User] = Depends(get_optional_current_user),
     x_request_id: Optional[str] = Header(None),
     x_forwarded_for: Optional[str] = Header(None),
 ) -> RequestContext:
     """
-    요청 컨텍스트 의존성
+    요청 컨텍스트 의존성 (헤더 전용)
+
+    JWT 검증이나 DB 조회 없이 헤더만 읽으므로, 메타 정보 로깅만 필요한
+    엔드포인트가 인증 비용을 내지 않습니다. user_id가 필요하면
+    get_authed_request_context를 사용하세요.
 
     사용법:
         @router.post("/items")
         async def create_item(
             context: RequestContext = Depends(get_request_context)
         ):
-            # context.user_id, context.request_id 등을 사용
+            # context.request_id, context.client_ip 등을 사용
 
     Args:
-        user: 현재 사용자 객체 (선택)
         x_request_id: 요청 추적 ID
         x_forwarded_for: 클라이언트 IP (프록시 경유 시)
 
     Returns:
-        RequestContext: 요청 컨텍스트
+        RequestContext: 요청 컨텍스트 (user_id는 None)
     """
-    user_id = user.id if user else None
-    client_ip = x_forwarded_for.split(",")[0] if x_forwarded_for else None
+    client_ip = (
+        x_forwarded_for.partition(",")[0].strip() if x_forwarded_for else None
+    )
 
     return RequestContext(
-        user_id=user_id,
         request_id=x_request_id,
         client_ip=client_ip,
     )
+
+
+async def get_authed_request_context(
+    user: Optional[UserIdentity] = Depends(get_optional_identity),
+    context: RequestContext = Depends(get_request_context),
+) -> RequestContext:
+    """
+    요청 컨텍스트 의존성 (인증 포함)
+
+    헤더 전용 컨텍스트에 JWT에서 해석한 user_id를 더합니다.
+    토큰이 없거나 유효하지 않으면 user_id는 None으로 남습니다.
+
+    Args:
+        user: 사용자 식별 정보 (선택)
+        context: 헤더 기반 요청 컨텍스트
+
+    Returns:
+        RequestContext: user_id가 채워진 요청 컨텍스트
+    """
+    if user:
+        context.user_id = user.id
+
+    return context
@@ -3,11 +3,12 @@ JWT 토큰 생성 및 검증 유틸리티
 OAuth 인증 및 토큰 관리를 위한 보안 기능
 """
 
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 
 import jwt
-from jwt.exceptions import InvalidTokenError
+from jwt.exceptions import PyJWTError
 
 from server.app.core.config import settings
 
@@ -25,14 +26,17 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
     """
     to_encode = data.copy()
 
+    # 현재 시각은 한 번만 조회하고 정수 epoch로 바로 사용합니다
+    # (PyJWT는 exp/iat에 int epoch를 그대로 받습니다)
+    now = int(time.time())
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = now + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
 
     to_encode.update({
         "exp": expire,
-        "iat": datetime.utcnow(),
+        "iat": now,
         "type": "access"
     })
 
@@ -51,16 +55,19 @@ def create_refresh_token(data: Dict[str, Any]) -> tuple[str, datetime]:
         tuple[str, datetime]: (토큰 문자열, 만료 시간)
     """
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+
+    now = int(time.time())
+    expire = now + settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
 
     to_encode.update({
         "exp": expire,
-        "iat": datetime.utcnow(),
+        "iat": now,
         "type": "refresh"
     })
 
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt, expire
+    # DB 컬럼 경계에서만 datetime으로 변환합니다
+    return encoded_jwt, datetime.utcfromtimestamp(expire)
 
 
 def verify_token(token: str, token_type: str = "access") -> Optional[Dict[str, Any]]:
@@ -77,20 +84,13 @@ def verify_token(token: str, token_type: str = "access") -> Optional[Dict[str, A
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
 
-        # 토큰 타입 검증
+        # 토큰 타입 검증 (만료 검증은 jwt.decode가 ExpiredSignatureError로 처리)
         if payload.get("type") != token_type:
             return None
 
-        # 만료 시간 검증 (jwt.decode가 자동으로 수행하지만 명시적으로 확인)
-        exp = payload.get("exp")
-        if exp and datetime.fromtimestamp(exp) < datetime.utcnow():
-            return None
-
         return payload
 
-    except InvalidTokenError:
-        return None
-    except Exception:
+    except PyJWTError:
         return None
 
 
@@ -112,7 +112,7 @@ def decode_google_token(token: str) -> Optional[Dict[str, Any]]:
         # 프로덕션에서는 google.auth.transport.requests를 사용하여 검증 필요
         payload = jwt.decode(token, options={"verify_signature": False})
         return payload
-    except Exception:
+    except PyJWTError:
         return None
 
 
@@ -132,5 +132,5 @@ def get_token_expiry_time(token: str) -> Optional[datetime]:
         if exp:
             return datetime.fromtimestamp(exp)
         return None
-    except Exception:
+    except PyJWTError:
         return None
@@ -4,11 +4,13 @@
 OAuth 로그인 및 토큰 관리 API 엔드포인트를 제공합니다.
 """
 
+import hashlib
+import hmac
 from datetime import datetime, timedelta
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from server.app.core.config import settings
@@ -33,6 +35,11 @@ from server.app.domain.user.models.user import User
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
+def _hash_refresh_token(token: str) -> bytes:
+    """Refresh Token의 저장용 blake2b 해시(16바이트)를 계산합니다."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
 @router.post("/google/login", response_model=LoginResponse, status_code=status.HTTP_200_OK)
 async def google_login(
     request: GoogleLoginRequest,
@@ -71,22 +78,28 @@ async def google_login(
             detail="Invalid Google user data",
         )
 
-    # 이메일 도메인 추출
-    email_domain = email.split("@")[1] if "@" in email else None
-    if not email_domain:
+    # 이메일 도메인 추출 (rpartition — 한 번의 스캔, 리스트 할당 없음)
+    _, at, email_domain = email.rpartition("@")
+    if not at or not email_domain:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid email format",
         )
 
-    # 회사 조회 (도메인으로)
-    company_result = await db.execute(
-        select(Company).where(Company.domain == email_domain)
-    )
-    company = company_result.scalar_one_or_none()
+    # 회사(도메인)와 사용자(google_id)를 한 번의 왕복으로 함께 조회
+    row = (
+        await db.execute(
+            select(Company, User)
+            .outerjoin(User, User.google_id == google_id)
+            .where(Company.domain == email_domain)
+        )
+    ).first()
 
-    # 회사가 없으면 생성
-    if not company:
+    if row is not None:
+        company, user = row.Company, row.User
+    else:
+        # 도메인이 처음 등장한 경우 — 회사를 생성하고, (드물지만 이메일
+        # 도메인이 바뀐 기존 사용자일 수 있으므로) 사용자만 별도 조회
         company = Company(
             name=email_domain,
             domain=email_domain,
@@ -95,11 +108,10 @@ async def google_login(
         db.add(company)
         await db.flush()
 
-    # 사용자 조회
-    user_result = await db.execute(
-        select(User).where(User.google_id == google_id)
-    )
-    user = user_result.scalar_one_or_none()
+        user_result = await db.execute(
+            select(User).where(User.google_id == google_id)
+        )
+        user = user_result.scalar_one_or_none()
 
     # 사용자가 없으면 생성
     if not user:
@@ -132,12 +144,13 @@ async def google_login(
         data={"user_id": user.id}
     )
 
-    # Refresh Token을 데이터베이스에 저장
-    user.refresh_token = refresh_token_str
+    # Refresh Token은 해시만 데이터베이스에 저장
+    user.refresh_token = _hash_refresh_token(refresh_token_str)
     user.refresh_token_expires_at = refresh_token_expires
 
+    # refresh 불필요 — 응답에 쓰는 필드는 모두 우리가 방금 채웠거나
+    # flush()가 돌려준 값(id, company_id 등)입니다
     await db.commit()
-    await db.refresh(user)
 
     # 응답 생성
     return LoginResponse(
@@ -189,25 +202,36 @@ async def refresh_access_token(
             detail="Invalid token payload",
         )
 
-    # 데이터베이스에서 사용자 조회
-    user_result = await db.execute(select(User).where(User.id == user_id))
-    user = user_result.scalar_one_or_none()
+    # 검증에 필요한 컬럼만 조회 (전체 User 로우 구체화 생략)
+    row = (
+        await db.execute(
+            select(
+                User.id,
+                User.email,
+                User.role,
+                User.refresh_token,
+                User.refresh_token_expires_at,
+            ).where(User.id == user_id)
+        )
+    ).one_or_none()
 
-    if not user:
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
 
-    # 저장된 Refresh Token과 비교
-    if user.refresh_token != request.refresh_token:
+    # 저장된 해시와 상수 시간 비교
+    if row.refresh_token is None or not hmac.compare_digest(
+        row.refresh_token, _hash_refresh_token(request.refresh_token)
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid refresh token",
         )
 
     # Refresh Token 만료 확인
-    if user.refresh_token_expires_at and user.refresh_token_expires_at < datetime.utcnow():
+    if row.refresh_token_expires_at and row.refresh_token_expires_at < datetime.utcnow():
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Refresh token expired",
@@ -216,22 +240,27 @@ async def refresh_access_token(
     # 새로운 Access Token 생성
     access_token = create_access_token(
         data={
-            "user_id": user.id,
-            "email": user.email,
-            "role": user.role,
+            "user_id": row.id,
+            "email": row.email,
+            "role": row.role,
         }
     )
 
     # 새로운 Refresh Token 생성 (Refresh Token Rotation)
     refresh_token_str, refresh_token_expires = create_refresh_token(
-        data={"user_id": user.id}
+        data={"user_id": row.id}
     )
 
-    # 새로운 Refresh Token을 데이터베이스에 저장
-    user.refresh_token = refresh_token_str
-    user.refresh_token_expires_at = refresh_token_expires
-    user.updated_at = datetime.utcnow()
-
+    # 새로운 Refresh Token 해시를 기본 키 기준 UPDATE로 저장 (ORM 객체 불필요)
+    await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(
+            refresh_token=_hash_refresh_token(refresh_token_str),
+            refresh_token_expires_at=refresh_token_expires,
+            updated_at=datetime.utcnow(),
+        )
+    )
     await db.commit()
 
     return TokenResponse(
@@ -256,9 +285,14 @@ async def logout(
         user: 현재 인증된 사용자
         db: 데이터베이스 세션
     """
-    # Refresh Token 삭제
-    user.refresh_token = None
-    user.refresh_token_expires_at = None
-    user.updated_at = datetime.utcnow()
-
+    # Refresh Token 삭제 (기본 키 기준 단일 UPDATE)
+    await db.execute(
+        update(User)
+        .where(User.id == user.id)
+        .values(
+            refresh_token=None,
+            refresh_token_expires_at=None,
+            updated_at=datetime.utcnow(),
+        )
+    )
     await db.commit()
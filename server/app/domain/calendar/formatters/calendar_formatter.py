@@ -4,7 +4,9 @@
 캘린더 데이터를 API 응답 형식으로 변환합니다.
 """
 
-from typing import List
+from typing import List, Sequence, Union
+
+from sqlalchemy import Row
 
 from server.app.domain.calendar.models.calendar_event import CalendarEvent
 from server.app.domain.calendar.models.calendar_connection import CalendarConnection
@@ -22,17 +24,19 @@ class CalendarEventFormatter:
     """
 
     @staticmethod
-    def format_event(event: CalendarEvent) -> CalendarEventResponse:
+    def format_event(event: Union[CalendarEvent, Row]) -> CalendarEventResponse:
         """
         이벤트를 응답 스키마로 변환
 
         Args:
-            event: 이벤트 모델
+            event: 이벤트 모델 또는 동일 컬럼을 가진 Row
 
         Returns:
             CalendarEventResponse: 이벤트 응답 스키마
         """
-        return CalendarEventResponse(
+        # 우리 DB에서 읽은 신뢰 가능한 데이터이므로 필드 검증을 생략합니다
+        # (model_construct — 목록 엔드포인트에서 검증 비용이 지배적)
+        return CalendarEventResponse.model_construct(
             id=event.id,
             google_event_id=event.google_event_id,
             summary=event.summary,
@@ -48,12 +52,14 @@ class CalendarEventFormatter:
         )
 
     @staticmethod
-    def format_events(events: List[CalendarEvent]) -> List[CalendarEventResponse]:
+    def format_events(
+        events: Sequence[Union[CalendarEvent, Row]],
+    ) -> List[CalendarEventResponse]:
         """
         이벤트 목록을 응답 스키마 목록으로 변환
 
         Args:
-            events: 이벤트 모델 목록
+            events: 이벤트 모델 또는 Row 목록
 
         Returns:
             List[CalendarEventResponse]: 이벤트 응답 스키마 목록
@@ -73,7 +79,7 @@ class CalendarEventFormatter:
         Returns:
             CalendarConnectionResponse: 캘린더 연동 응답 스키마
         """
-        return CalendarConnectionResponse(
+        return CalendarConnectionResponse.model_construct(
             id=connection.id,
             user_id=connection.user_id,
             google_calendar_id=connection.google_calendar_id,
@@ -7,9 +7,11 @@ from server.app.domain.calendar.models.calendar_event import CalendarEvent
 from server.app.domain.calendar.models.calendar_event_selection import (
     CalendarEventSelection,
 )
+from server.app.domain.calendar.models.calendar_sync_job import CalendarSyncJob
 
 __all__ = [
     "CalendarConnection",
     "CalendarEvent",
     "CalendarEventSelection",
+    "CalendarSyncJob",
 ]
@@ -7,7 +7,18 @@
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
 
-from sqlalchemy import String, ForeignKey, Integer, DateTime, Text, Boolean, func
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from server.app.core.database import Base
@@ -25,8 +36,29 @@ class CalendarConnection(Base):
     """
     __tablename__ = "calendar_connections"
 
+    # INSERT/UPDATE가 RETURNING으로 서버 기본값(created_at 등)을 함께
+    # 돌려받도록 하여 flush 후 별도 refresh SELECT를 없앱니다
+    __mapper_args__ = {"eager_defaults": True}
+
+    # find_by_user_id/find_active_by_user_id가 쓰는 조회 경로에 맞춘 제약·인덱스.
+    # (user_id, google_calendar_id) 고유 제약은 DB에는 있었지만 모델에 없던
+    # 것을 선언하며, user_id 선두 컬럼 덕에 단독 user_id 인덱스도 대체합니다.
+    # 활성 연동 조회용 부분 인덱스는 Postgres에서만 생성됩니다.
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id",
+            "google_calendar_id",
+            name="uq_calendar_connections_user_calendar",
+        ),
+        Index(
+            "ix_calendar_connections_user_active",
+            "user_id",
+            postgresql_where=text("is_active IS TRUE"),
+        ),
+    )
+
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     google_calendar_id: Mapped[str] = mapped_column(String(255), nullable=False, default="primary")
 
     # OAuth Tokens
@@ -51,9 +83,14 @@ class CalendarConnection(Base):
     )
 
     # Relationships
-    user: Mapped["User"] = relationship("User", back_populates="calendar_connections")
+    # 연동 조회 경로는 관계를 읽지 않으므로 실수로 인한 lazy load가
+    # 명시적인 에러로 드러나도록 lazy="raise"로 선언합니다.
+    user: Mapped["User"] = relationship(
+        "User", back_populates="calendar_connections", lazy="raise"
+    )
     events: Mapped[List["CalendarEvent"]] = relationship(
         "CalendarEvent",
         back_populates="connection",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise",
     )
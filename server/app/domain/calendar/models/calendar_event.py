@@ -7,7 +7,19 @@
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
 
-from sqlalchemy import String, ForeignKey, Integer, DateTime, Text, Boolean, func, JSON
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from server.app.core.database import Base
@@ -25,28 +37,53 @@ class CalendarEvent(Base):
     """
     __tablename__ = "calendar_events"
 
+    # INSERT/UPDATE가 RETURNING으로 서버 기본값(synced_at 등)을 함께
+    # 돌려받도록 하여 flush 후 별도 refresh SELECT를 없앱니다
+    __mapper_args__ = {"eager_defaults": True}
+
+    # 실제 조회 패턴("연동 X의 기간 A~B 이벤트, 최신순")에 맞춘 복합 인덱스
+    # 하나가 connection_id 단독 인덱스를 포함해 대체하고, 고유 제약이
+    # (connection, google_event) 조회까지 담당합니다. is_filtered/is_selected
+    # 같은 저선택도 컬럼의 단독 인덱스는 쓰기 증폭만 늘려 제거했습니다.
+    __table_args__ = (
+        UniqueConstraint(
+            "calendar_connection_id",
+            "google_event_id",
+            name="uq_calendar_events_connection_event",
+        ),
+        Index(
+            "ix_calendar_events_conn_start",
+            "calendar_connection_id",
+            "start_time",
+        ),
+    )
+
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     calendar_connection_id: Mapped[int] = mapped_column(
         ForeignKey("calendar_connections.id", ondelete="CASCADE"),
         nullable=False,
-        index=True
     )
-    google_event_id: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    google_event_id: Mapped[str] = mapped_column(String(255), nullable=False)
 
     # Event Details
     summary: Mapped[str] = mapped_column(String(500), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    start_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+    start_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     end_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     location: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
 
     # Attendees
     attendees_count: Mapped[int] = mapped_column(Integer, default=0)
-    attendees_emails: Mapped[list] = mapped_column(JSON, default=list)
+    # Postgres 네이티브 배열 — 로드 시 JSON 파싱 없이 리스트로 디코딩됩니다.
+    # (SQLite 테스트 환경에서는 JSON으로 저장)
+    attendees_emails: Mapped[List[str]] = mapped_column(
+        ARRAY(String(320)).with_variant(JSON, "sqlite"),
+        default=list,
+    )
 
     # Filtering & Selection
-    is_filtered: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
-    is_selected: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
+    is_filtered: Mapped[bool] = mapped_column(Boolean, default=False)
+    is_selected: Mapped[bool] = mapped_column(Boolean, default=False)
 
     # Timestamps
     synced_at: Mapped[datetime] = mapped_column(
@@ -60,10 +97,16 @@ class CalendarEvent(Base):
     )
 
     # Relationships
-    connection: Mapped["CalendarConnection"] = relationship("CalendarConnection", back_populates="events")
+    # 조회 경로는 컬럼만 직렬화하므로 lazy="raise"로 선언해 실수로 인한
+    # lazy load가 N+1 대신 명시적인 에러로 드러나게 합니다.
+    # 필요해지면 해당 쿼리에 selectinload를 추가하세요.
+    connection: Mapped["CalendarConnection"] = relationship(
+        "CalendarConnection", back_populates="events", lazy="raise"
+    )
     selection: Mapped[Optional["CalendarEventSelection"]] = relationship(
         "CalendarEventSelection",
         back_populates="event",
         uselist=False,
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise",
     )
@@ -0,0 +1,62 @@
+"""
+캘린더 동기화 작업 모델
+
+백그라운드로 실행되는 이벤트 동기화 작업의 상태를 추적합니다.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from server.app.core.database import Base
+
+
+class CalendarSyncJob(Base):
+    """
+    캘린더 동기화 작업
+
+    POST /calendar/sync가 202로 즉시 응답하고 실제 동기화는 백그라운드에서
+    수행되므로, 진행 상태와 결과 카운터를 이 테이블로 조회합니다.
+    """
+    __tablename__ = "calendar_sync_jobs"
+
+    __mapper_args__ = {"eager_defaults": True}
+
+    # 상태 폴링은 항상 (id, user_id) 조합으로 오므로 PK 외 인덱스는
+    # 사용자별 최근 작업 조회용 하나만 둡니다
+    __table_args__ = (
+        Index("ix_calendar_sync_jobs_user_created", "user_id", "created_at"),
+    )
+
+    # 작업 상태 값
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_COMPLETED = "completed"
+    STATUS_FAILED = "failed"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+
+    # Status
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default=STATUS_PENDING
+    )
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    # Result Counters
+    synced_count: Mapped[int] = mapped_column(Integer, default=0)
+    filtered_count: Mapped[int] = mapped_column(Integer, default=0)
+    new_count: Mapped[int] = mapped_column(Integer, default=0)
+    updated_count: Mapped[int] = mapped_column(Integer, default=0)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -4,10 +4,24 @@
 캘린더 데이터 조회 및 관리를 담당합니다.
 """
 
-from datetime import datetime
-from typing import Optional, List
-
-from sqlalchemy import select, and_, or_, update, delete
+from datetime import datetime, timezone
+from typing import Optional, List, Set, Dict, Any
+
+from sqlalchemy import (
+    select,
+    and_,
+    or_,
+    update,
+    delete,
+    func,
+    case,
+    tuple_,
+    literal,
+    bindparam,
+    lambda_stmt,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from server.app.domain.calendar.models.calendar_connection import CalendarConnection
@@ -15,10 +29,21 @@ from server.app.domain.calendar.models.calendar_event import CalendarEvent
 from server.app.domain.calendar.models.calendar_event_selection import (
     CalendarEventSelection,
 )
+from server.app.domain.calendar.models.calendar_sync_job import CalendarSyncJob
 from server.app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# IN (...) 절에 한 번에 넣는 최대 파라미터 수.
+# 이보다 긴 목록은 나눠 실행해 플래닝 비용과 드라이버 파라미터 한도를 피합니다.
+_IN_CLAUSE_CHUNK_SIZE = 1000
+
+
+def _chunks(items: list, size: int = _IN_CLAUSE_CHUNK_SIZE):
+    """목록을 size 단위로 잘라 순서대로 돌려주는 제너레이터"""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
 
 class CalendarConnectionRepository:
     """
@@ -49,14 +74,19 @@ class CalendarConnectionRepository:
         Returns:
             Optional[CalendarConnection]: 캘린더 연동 정보
         """
-        result = await self.db.execute(
-            select(CalendarConnection).where(
+        # lambda_stmt — 매 요청 반복되는 statement 객체 생성을 건너뛰고
+        # 캐시된 구조에 바인드 값만 바꿔 실행합니다
+        stmt = lambda_stmt(
+            lambda: select(CalendarConnection).where(
                 and_(
-                    CalendarConnection.user_id == user_id,
-                    CalendarConnection.google_calendar_id == calendar_id,
+                    CalendarConnection.user_id == bindparam("user_id"),
+                    CalendarConnection.google_calendar_id == bindparam("calendar_id"),
                 )
             )
         )
+        result = await self.db.execute(
+            stmt, {"user_id": user_id, "calendar_id": calendar_id}
+        )
         return result.scalar_one_or_none()
 
     async def find_active_by_user_id(
@@ -72,14 +102,15 @@ class CalendarConnectionRepository:
         Returns:
             List[CalendarConnection]: 활성 캘린더 연동 목록
         """
-        result = await self.db.execute(
-            select(CalendarConnection).where(
+        stmt = lambda_stmt(
+            lambda: select(CalendarConnection).where(
                 and_(
-                    CalendarConnection.user_id == user_id,
+                    CalendarConnection.user_id == bindparam("user_id"),
                     CalendarConnection.is_active == True,
                 )
             )
         )
+        result = await self.db.execute(stmt, {"user_id": user_id})
         return list(result.scalars().all())
 
     async def create(
@@ -95,9 +126,10 @@ class CalendarConnectionRepository:
         Returns:
             CalendarConnection: 생성된 캘린더 연동 정보
         """
+        # eager_defaults 덕분에 flush의 INSERT .. RETURNING이 서버 기본값을
+        # 함께 돌려주므로 refresh가 필요 없습니다
         self.db.add(connection)
         await self.db.flush()
-        await self.db.refresh(connection)
         return connection
 
     async def update(
@@ -113,9 +145,8 @@ class CalendarConnectionRepository:
         Returns:
             CalendarConnection: 업데이트된 캘린더 연동 정보
         """
-        connection.updated_at = datetime.utcnow()
+        connection.updated_at = datetime.now(timezone.utc)
         await self.db.flush()
-        await self.db.refresh(connection)
         return connection
 
     async def deactivate(
@@ -128,10 +159,12 @@ class CalendarConnectionRepository:
         Args:
             connection_id: 캘린더 연동 ID
         """
+        # updated_at은 DB가 계산 — 파라미터 하나를 덜 보내고 앱/DB 시계
+        # 차이로 인한 타임스탬프 드리프트를 없앱니다
         await self.db.execute(
             update(CalendarConnection)
             .where(CalendarConnection.id == connection_id)
-            .values(is_active=False, updated_at=datetime.utcnow())
+            .values(is_active=False, updated_at=func.now())
         )
 
     async def delete(
@@ -194,6 +227,78 @@ class CalendarEventRepository:
         )
         return list(result.scalars().all())
 
+    # 목록 응답이 사용하는 컬럼만 조회합니다 (ORM 인스턴스 생성과
+    # 아이덴티티 맵 등록을 건너뛰고 읽기 전용 Row로 반환)
+    _LISTING_COLUMNS = (
+        CalendarEvent.id,
+        CalendarEvent.google_event_id,
+        CalendarEvent.summary,
+        CalendarEvent.description,
+        CalendarEvent.start_time,
+        CalendarEvent.end_time,
+        CalendarEvent.location,
+        CalendarEvent.attendees_count,
+        CalendarEvent.attendees_emails,
+        CalendarEvent.is_filtered,
+        CalendarEvent.is_selected,
+        CalendarEvent.synced_at,
+    )
+
+    async def find_rows_for_listing(
+        self,
+        connection_id: int,
+        is_filtered: Optional[bool] = None,
+        is_selected: Optional[bool] = None,
+        limit: Optional[int] = None,
+        cursor_start_time: Optional[datetime] = None,
+        cursor_id: Optional[int] = None,
+    ) -> List:
+        """
+        목록 응답에 필요한 컬럼만 Row로 조회
+
+        find_by_connection_id와 같은 조건이지만 전체 엔티티를 수화하지
+        않아 읽기 전용 목록 경로에서 행당 비용이 훨씬 낮습니다.
+        Row는 컬럼명 속성 접근을 지원하므로 포맷터에 그대로 전달됩니다.
+
+        페이지네이션은 (start_time, id) 키셋 방식입니다. 마지막으로 받은
+        행의 두 값을 커서로 넘기면 OFFSET과 달리 페이지 깊이와 무관하게
+        복합 인덱스 범위 스캔 한 번으로 다음 페이지를 가져옵니다.
+
+        Args:
+            connection_id: 캘린더 연동 ID
+            is_filtered: 필터링 여부 (None이면 전체)
+            is_selected: 선택 여부 (None이면 전체)
+            limit: 최대 행 수 (None이면 전체)
+            cursor_start_time: 키셋 커서 — 이전 페이지 마지막 행의 start_time
+            cursor_id: 키셋 커서 — 이전 페이지 마지막 행의 id
+
+        Returns:
+            List: 이벤트 Row 목록 (start_time, id 내림차순)
+        """
+        conditions = [CalendarEvent.calendar_connection_id == connection_id]
+
+        if is_filtered is not None:
+            conditions.append(CalendarEvent.is_filtered == is_filtered)
+        if is_selected is not None:
+            conditions.append(CalendarEvent.is_selected == is_selected)
+        if cursor_start_time is not None and cursor_id is not None:
+            # 내림차순 정렬이므로 커서보다 "작은" 행이 다음 페이지
+            conditions.append(
+                tuple_(CalendarEvent.start_time, CalendarEvent.id)
+                < tuple_(cursor_start_time, cursor_id)
+            )
+
+        stmt = (
+            select(*self._LISTING_COLUMNS)
+            .where(and_(*conditions))
+            .order_by(CalendarEvent.start_time.desc(), CalendarEvent.id.desc())
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        result = await self.db.execute(stmt)
+        return list(result.all())
+
     async def find_by_google_event_id(
         self,
         connection_id: int,
@@ -209,14 +314,17 @@ class CalendarEventRepository:
         Returns:
             Optional[CalendarEvent]: 이벤트
         """
-        result = await self.db.execute(
-            select(CalendarEvent).where(
+        stmt = lambda_stmt(
+            lambda: select(CalendarEvent).where(
                 and_(
-                    CalendarEvent.calendar_connection_id == connection_id,
-                    CalendarEvent.google_event_id == google_event_id,
+                    CalendarEvent.calendar_connection_id == bindparam("connection_id"),
+                    CalendarEvent.google_event_id == bindparam("google_event_id"),
                 )
             )
         )
+        result = await self.db.execute(
+            stmt, {"connection_id": connection_id, "google_event_id": google_event_id}
+        )
         return result.scalar_one_or_none()
 
     async def find_by_id(
@@ -232,9 +340,12 @@ class CalendarEventRepository:
         Returns:
             Optional[CalendarEvent]: 이벤트
         """
-        result = await self.db.execute(
-            select(CalendarEvent).where(CalendarEvent.id == event_id)
+        stmt = lambda_stmt(
+            lambda: select(CalendarEvent).where(
+                CalendarEvent.id == bindparam("event_id")
+            )
         )
+        result = await self.db.execute(stmt, {"event_id": event_id})
         return result.scalar_one_or_none()
 
     async def create(
@@ -252,7 +363,6 @@ class CalendarEventRepository:
         """
         self.db.add(event)
         await self.db.flush()
-        await self.db.refresh(event)
         return event
 
     async def update(
@@ -268,30 +378,125 @@ class CalendarEventRepository:
         Returns:
             CalendarEvent: 업데이트된 이벤트 정보
         """
-        event.updated_at = datetime.utcnow()
-        event.synced_at = datetime.utcnow()
+        # 시각은 한 번만 계산 — utcnow()는 3.12부터 deprecated인 데다
+        # naive라서 TIMESTAMPTZ 컬럼과 섞이면 비교/저장이 어긋납니다
+        now = datetime.now(timezone.utc)
+        event.updated_at = now
+        event.synced_at = now
         await self.db.flush()
-        await self.db.refresh(event)
         return event
 
-    async def update_selection_status(
+    async def find_existing_google_event_ids(
         self,
+        connection_id: int,
+        google_event_ids: List[str],
+    ) -> Set[str]:
+        """
+        주어진 구글 이벤트 ID 중 이미 저장된 ID 집합 조회
+
+        Args:
+            connection_id: 캘린더 연동 ID
+            google_event_ids: 구글 이벤트 ID 목록
+
+        Returns:
+            Set[str]: 이미 저장된 구글 이벤트 ID 집합
+        """
+        if not google_event_ids:
+            return set()
+
+        result = await self.db.execute(
+            select(CalendarEvent.google_event_id).where(
+                and_(
+                    CalendarEvent.calendar_connection_id == connection_id,
+                    CalendarEvent.google_event_id.in_(google_event_ids),
+                )
+            )
+        )
+        return set(result.scalars().all())
+
+    async def bulk_upsert(
+        self,
+        events: List[Dict[str, Any]],
+    ) -> None:
+        """
+        이벤트 일괄 업서트
+
+        (calendar_connection_id, google_event_id) 고유 제약을 이용해
+        배치 전체를 INSERT ... ON CONFLICT DO UPDATE 한 번으로 반영합니다.
+        건별 SELECT + INSERT/UPDATE 왕복(3N)이 1회로 줄어듭니다.
+        is_selected는 사용자 선택 상태이므로 재동기화 시 덮어쓰지 않습니다.
+
+        Args:
+            events: CalendarEvent 컬럼 딕셔너리 목록
+        """
+        if not events:
+            return
+
+        # 테스트 환경(SQLite)에서도 동작하도록 다이얼렉트별 insert를 선택
+        insert = (
+            sqlite_insert if self.db.bind.dialect.name == "sqlite" else pg_insert
+        )
+        stmt = insert(CalendarEvent).values(events)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["calendar_connection_id", "google_event_id"],
+            set_={
+                "summary": stmt.excluded.summary,
+                "description": stmt.excluded.description,
+                "start_time": stmt.excluded.start_time,
+                "end_time": stmt.excluded.end_time,
+                "location": stmt.excluded.location,
+                "attendees_count": stmt.excluded.attendees_count,
+                "attendees_emails": stmt.excluded.attendees_emails,
+                "is_filtered": stmt.excluded.is_filtered,
+                "synced_at": func.now(),
+                "updated_at": func.now(),
+            },
+        )
+        await self.db.execute(stmt)
+
+    async def bulk_set_selection(
+        self,
+        user_id: int,
         event_ids: List[int],
         is_selected: bool,
-    ) -> None:
+    ) -> List[int]:
         """
-        이벤트 선택 상태 업데이트
+        이벤트 선택 상태 일괄 업데이트 (소유권 검증 포함)
+
+        해당 사용자의 연동에 속한 이벤트만 갱신하고 실제로 바뀐 행의
+        ID를 RETURNING으로 돌려줍니다. 권한 확인과 갱신이 한 문장으로
+        끝나므로 남의 이벤트 ID가 섞여 있어도 조용히 걸러집니다.
 
         Args:
+            user_id: 사용자 ID
             event_ids: 이벤트 ID 목록
             is_selected: 선택 여부
+
+        Returns:
+            List[int]: 실제로 업데이트된 이벤트 ID 목록
         """
-        await self.db.execute(
-            update(CalendarEvent)
-            .where(CalendarEvent.id.in_(event_ids))
-            .values(is_selected=is_selected, updated_at=datetime.utcnow())
+        connection_ids = select(CalendarConnection.id).where(
+            CalendarConnection.user_id == user_id
         )
 
+        updated: List[int] = []
+        for chunk in _chunks(event_ids):
+            result = await self.db.execute(
+                update(CalendarEvent)
+                .where(
+                    and_(
+                        CalendarEvent.id.in_(chunk),
+                        CalendarEvent.calendar_connection_id.in_(
+                            connection_ids
+                        ),
+                    )
+                )
+                .values(is_selected=is_selected, updated_at=func.now())
+                .returning(CalendarEvent.id)
+            )
+            updated.extend(result.scalars().all())
+        return updated
+
     async def delete_by_google_event_ids(
         self,
         connection_id: int,
@@ -304,14 +509,15 @@ class CalendarEventRepository:
             connection_id: 캘린더 연동 ID
             google_event_ids: 구글 이벤트 ID 목록
         """
-        await self.db.execute(
-            delete(CalendarEvent).where(
-                and_(
-                    CalendarEvent.calendar_connection_id == connection_id,
-                    CalendarEvent.google_event_id.in_(google_event_ids),
+        for chunk in _chunks(google_event_ids):
+            await self.db.execute(
+                delete(CalendarEvent).where(
+                    and_(
+                        CalendarEvent.calendar_connection_id == connection_id,
+                        CalendarEvent.google_event_id.in_(chunk),
+                    )
                 )
             )
-        )
 
     async def delete_by_connection_id(
         self,
@@ -329,6 +535,93 @@ class CalendarEventRepository:
             )
         )
 
+    async def count_summary(
+        self,
+        connection_id: int,
+    ) -> tuple[int, int, int]:
+        """
+        연동의 전체/필터링/선택 이벤트 개수를 한 번의 쿼리로 조회
+
+        count_by_connection_id를 세 번 호출하던 것을 조건부 집계
+        (SUM(CASE WHEN ...)) 하나로 합쳐 왕복을 3회에서 1회로 줄입니다.
+
+        Args:
+            connection_id: 캘린더 연동 ID
+
+        Returns:
+            tuple[int, int, int]: (전체, 필터링, 선택) 이벤트 개수
+        """
+        result = await self.db.execute(
+            select(
+                func.count(CalendarEvent.id),
+                func.coalesce(
+                    func.sum(case((CalendarEvent.is_filtered, 1), else_=0)), 0
+                ),
+                func.coalesce(
+                    func.sum(case((CalendarEvent.is_selected, 1), else_=0)), 0
+                ),
+            ).where(CalendarEvent.calendar_connection_id == connection_id)
+        )
+        total, filtered_count, selected_count = result.one()
+        return total, filtered_count, selected_count
+
+    async def change_marker(
+        self,
+        connection_id: int,
+    ) -> tuple[Optional[datetime], int]:
+        """
+        연동 이벤트들의 변경 마커 조회
+
+        (MAX(updated_at), COUNT(*)) 한 쌍은 이벤트가 추가·수정·삭제될
+        때마다 달라지므로 ETag 등 조건부 응답의 기준값으로 쓰입니다.
+
+        Args:
+            connection_id: 캘린더 연동 ID
+
+        Returns:
+            tuple[Optional[datetime], int]: (마지막 수정 시각, 전체 개수)
+        """
+        result = await self.db.execute(
+            select(
+                func.max(CalendarEvent.updated_at),
+                func.count(CalendarEvent.id),
+            ).where(CalendarEvent.calendar_connection_id == connection_id)
+        )
+        max_updated_at, total = result.one()
+        return max_updated_at, total
+
+    async def exists_by_connection_id(
+        self,
+        connection_id: int,
+        is_filtered: Optional[bool] = None,
+        is_selected: Optional[bool] = None,
+    ) -> bool:
+        """
+        조건에 맞는 이벤트 존재 여부만 확인
+
+        개수가 필요 없는 "있는가?" 판단에는 COUNT(*) 전체 스캔 대신
+        SELECT 1 ... LIMIT 1로 첫 매칭 행에서 바로 멈춥니다.
+
+        Args:
+            connection_id: 캘린더 연동 ID
+            is_filtered: 필터링 여부 (None이면 전체)
+            is_selected: 선택 여부 (None이면 전체)
+
+        Returns:
+            bool: 존재 여부
+        """
+        conditions = [CalendarEvent.calendar_connection_id == connection_id]
+
+        if is_filtered is not None:
+            conditions.append(CalendarEvent.is_filtered == is_filtered)
+        if is_selected is not None:
+            conditions.append(CalendarEvent.is_selected == is_selected)
+
+        result = await self.db.execute(
+            select(literal(1)).where(and_(*conditions)).limit(1)
+        )
+        return result.scalar() is not None
+
     async def count_by_connection_id(
         self,
         connection_id: int,
@@ -346,8 +639,6 @@ class CalendarEventRepository:
         Returns:
             int: 이벤트 개수
         """
-        from sqlalchemy import func
-
         conditions = [CalendarEvent.calendar_connection_id == connection_id]
 
         if is_filtered is not None:
@@ -359,3 +650,120 @@ class CalendarEventRepository:
             select(func.count(CalendarEvent.id)).where(and_(*conditions))
         )
         return result.scalar_one()
+
+
+class CalendarSyncJobRepository:
+    """
+    캘린더 동기화 작업 레포지토리
+
+    백그라운드 동기화 작업의 상태를 조회하고 갱신합니다.
+    """
+
+    def __init__(self, db: AsyncSession):
+        """
+        Args:
+            db: 데이터베이스 세션
+        """
+        self.db = db
+
+    async def create(
+        self,
+        user_id: int,
+    ) -> CalendarSyncJob:
+        """
+        동기화 작업 생성 (pending 상태)
+
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            CalendarSyncJob: 생성된 작업
+        """
+        job = CalendarSyncJob(user_id=user_id, status=CalendarSyncJob.STATUS_PENDING)
+        self.db.add(job)
+        await self.db.flush()
+        return job
+
+    async def find_by_id(
+        self,
+        job_id: int,
+    ) -> Optional[CalendarSyncJob]:
+        """
+        작업 ID로 동기화 작업 조회
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            Optional[CalendarSyncJob]: 동기화 작업
+        """
+        return await self.db.get(CalendarSyncJob, job_id)
+
+    async def mark_running(
+        self,
+        job_id: int,
+    ) -> None:
+        """
+        작업을 실행 중 상태로 변경
+
+        Args:
+            job_id: 작업 ID
+        """
+        await self.db.execute(
+            update(CalendarSyncJob)
+            .where(CalendarSyncJob.id == job_id)
+            .values(status=CalendarSyncJob.STATUS_RUNNING, updated_at=func.now())
+        )
+
+    async def mark_completed(
+        self,
+        job_id: int,
+        synced_count: int,
+        filtered_count: int,
+        new_count: int,
+        updated_count: int,
+    ) -> None:
+        """
+        작업을 완료 상태로 변경하고 결과 카운터 기록
+
+        Args:
+            job_id: 작업 ID
+            synced_count: 동기화된 이벤트 수
+            filtered_count: 필터링된 이벤트 수
+            new_count: 새로 추가된 이벤트 수
+            updated_count: 업데이트된 이벤트 수
+        """
+        await self.db.execute(
+            update(CalendarSyncJob)
+            .where(CalendarSyncJob.id == job_id)
+            .values(
+                status=CalendarSyncJob.STATUS_COMPLETED,
+                synced_count=synced_count,
+                filtered_count=filtered_count,
+                new_count=new_count,
+                updated_count=updated_count,
+                updated_at=func.now(),
+            )
+        )
+
+    async def mark_failed(
+        self,
+        job_id: int,
+        error: str,
+    ) -> None:
+        """
+        작업을 실패 상태로 변경하고 오류 메시지 기록
+
+        Args:
+            job_id: 작업 ID
+            error: 오류 메시지
+        """
+        await self.db.execute(
+            update(CalendarSyncJob)
+            .where(CalendarSyncJob.id == job_id)
+            .values(
+                status=CalendarSyncJob.STATUS_FAILED,
+                error=error,
+                updated_at=func.now(),
+            )
+        )
@@ -4,20 +4,32 @@
 캘린더 연동 및 이벤트 관리 API 엔드포인트를 제공합니다.
 """
 
+import hashlib
+from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    status,
+    Request,
+    Response,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from server.app.core.database import get_db
 from server.app.core.dependencies import get_current_user
 from server.app.domain.user.models.user import User
-from server.app.domain.calendar.service import CalendarService
+from server.app.domain.calendar.service import CalendarService, run_sync_job
 from server.app.domain.calendar.schemas.calendar import (
     CalendarConnectionCreate,
     CalendarConnectionResponse,
     CalendarEventResponse,
     CalendarEventListResponse,
+    CalendarSyncJobResponse,
     CalendarSyncRequest,
     CalendarSyncResponse,
     EventSelectionRequest,
@@ -29,6 +41,15 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/calendar", tags=["Calendar"])
 
+# 조건부 GET 응답의 클라이언트 캐시 수명
+_CACHE_CONTROL = "private, max-age=30"
+
+
+def _etag(*parts) -> str:
+    """변경 마커들로부터 조건부 GET용 ETag 생성"""
+    raw = ":".join(str(part) for part in parts)
+    return f'"{hashlib.sha256(raw.encode()).hexdigest()[:16]}"'
+
 
 @router.post(
     "/connect",
@@ -72,13 +93,20 @@ async def connect_calendar(
     status_code=status.HTTP_200_OK,
 )
 async def get_calendar_connection(
+    request: Request,
+    response: Response,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> CalendarConnectionResponse:
     """
     캘린더 연동 상태 조회
 
+    연동 정보가 바뀌지 않았으면 If-None-Match 기반으로 304를 돌려
+    본문 생성과 전송을 생략합니다.
+
     Args:
+        request: FastAPI Request (If-None-Match 확인용)
+        response: FastAPI Response (캐시 헤더 설정용)
         user: 현재 인증된 사용자
         db: 데이터베이스 세션
 
@@ -93,6 +121,12 @@ async def get_calendar_connection(
         service = CalendarService(db)
         connection = await service.get_connection(user_id=user.id)
         logger.info(f"Connection found for user_id={user.id}: {connection.id if connection else 'None'}")
+
+        etag = _etag(connection.id, connection.updated_at)
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = _CACHE_CONTROL
         return connection
     except ValueError as e:
         logger.error(f"Calendar connection not found: {e}", extra={"error": str(e)})
@@ -145,33 +179,43 @@ async def delete_calendar_connection(
 
 @router.post(
     "/sync",
-    response_model=CalendarSyncResponse,
-    status_code=status.HTTP_200_OK,
+    response_model=CalendarSyncJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
 )
 async def sync_calendar_events(
     request: CalendarSyncRequest,
+    background_tasks: BackgroundTasks,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> CalendarSyncResponse:
+) -> CalendarSyncJobResponse:
     """
-    캘린더 이벤트 동기화
+    캘린더 이벤트 동기화 시작
+
+    구글 API 왕복과 대량 쓰기가 요청을 붙잡지 않도록 작업을 만들어
+    202로 즉시 응답하고 실제 동기화는 백그라운드에서 실행합니다.
+    진행 상태는 GET /calendar/sync/jobs/{job_id}로 폴링합니다.
 
     Args:
         request: 동기화 요청
+        background_tasks: FastAPI 백그라운드 작업 큐
         user: 현재 인증된 사용자
         db: 데이터베이스 세션
 
     Returns:
-        CalendarSyncResponse: 동기화 결과
+        CalendarSyncJobResponse: 생성된 동기화 작업 (pending)
     """
     try:
         service = CalendarService(db)
-        return await service.sync_events(
-            user_id=user.id,
-            time_min=request.time_min,
-            time_max=request.time_max,
-            max_results=request.max_results,
+        job = await service.create_sync_job(user_id=user.id)
+        background_tasks.add_task(
+            run_sync_job,
+            job.id,
+            user.id,
+            request.time_min,
+            request.time_max,
+            request.max_results,
         )
+        return job
     except ValueError as e:
         logger.error(f"Calendar sync failed: {e}", extra={"error": str(e)})
         raise HTTPException(
@@ -186,23 +230,81 @@ async def sync_calendar_events(
         )
 
 
+@router.get(
+    "/sync/jobs/{job_id}",
+    response_model=CalendarSyncJobResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_sync_job(
+    job_id: int,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> CalendarSyncJobResponse:
+    """
+    동기화 작업 상태 조회
+
+    Args:
+        job_id: 동기화 작업 ID
+        user: 현재 인증된 사용자
+        db: 데이터베이스 세션
+
+    Returns:
+        CalendarSyncJobResponse: 작업 상태와 결과 카운터
+
+    Raises:
+        HTTPException: 작업을 찾을 수 없는 경우 404 에러
+    """
+    try:
+        service = CalendarService(db)
+        return await service.get_sync_job(user_id=user.id, job_id=job_id)
+    except ValueError as e:
+        logger.error(f"Sync job not found: {e}", extra={"error": str(e)})
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"Failed to get sync job: {e}", extra={"error": str(e)})
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get sync job: {str(e)}",
+        )
+
+
 @router.get(
     "/events",
     response_model=CalendarEventListResponse,
     status_code=status.HTTP_200_OK,
 )
 async def list_calendar_events(
+    request: Request,
+    response: Response,
     is_filtered: Optional[bool] = None,
     is_selected: Optional[bool] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=500),
+    cursor_start_time: Optional[datetime] = None,
+    cursor_id: Optional[int] = None,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> CalendarEventListResponse:
     """
     캘린더 이벤트 목록 조회
 
+    limit과 커서(cursor_start_time, cursor_id — 이전 페이지 마지막
+    이벤트의 start_time/id)를 넘기면 키셋 방식으로 페이지네이션됩니다.
+    생략하면 기존처럼 전체 목록을 반환합니다.
+
+    이벤트가 바뀌지 않았으면 If-None-Match 기반으로 304를 돌려
+    목록 조회·직렬화를 통째로 생략합니다 (변경 마커 쿼리 1회만 실행).
+
     Args:
+        request: FastAPI Request (If-None-Match 확인용)
+        response: FastAPI Response (캐시 헤더 설정용)
         is_filtered: 필터링 여부
         is_selected: 선택 여부
+        limit: 페이지 크기 (최대 500)
+        cursor_start_time: 키셋 커서 start_time
+        cursor_id: 키셋 커서 id
         user: 현재 인증된 사용자
         db: 데이터베이스 세션
 
@@ -211,11 +313,27 @@ async def list_calendar_events(
     """
     try:
         service = CalendarService(db)
-        return await service.list_events(
+
+        # 변경 마커에 필터/커서 파라미터를 섞어 조회 조건별로 ETag가 달라지게 함
+        max_updated_at, total = await service.get_events_etag(user_id=user.id)
+        etag = _etag(
+            max_updated_at, total, is_filtered, is_selected,
+            limit, cursor_start_time, cursor_id,
+        )
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+        result = await service.list_events(
             user_id=user.id,
             is_filtered=is_filtered,
             is_selected=is_selected,
+            limit=limit,
+            cursor_start_time=cursor_start_time,
+            cursor_id=cursor_id,
         )
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = _CACHE_CONTROL
+        return result
     except ValueError as e:
         logger.error(f"Failed to list events: {e}", extra={"error": str(e)})
         raise HTTPException(
@@ -161,6 +161,37 @@ class CalendarSyncResponse(BaseModel):
     )
 
 
+class CalendarSyncJobResponse(BaseModel):
+    """캘린더 동기화 작업 상태 응답"""
+
+    id: int
+    status: str = Field(..., description="작업 상태 (pending/running/completed/failed)")
+    synced_count: int = Field(0, description="동기화된 이벤트 수")
+    filtered_count: int = Field(0, description="필터링된 이벤트 수")
+    new_count: int = Field(0, description="새로 추가된 이벤트 수")
+    updated_count: int = Field(0, description="업데이트된 이벤트 수")
+    error: Optional[str] = Field(None, description="실패 시 오류 메시지")
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "id": 1,
+                "status": "completed",
+                "synced_count": 10,
+                "filtered_count": 5,
+                "new_count": 3,
+                "updated_count": 2,
+                "error": None,
+                "created_at": "2026-01-16T10:00:00Z",
+                "updated_at": "2026-01-16T10:00:05Z"
+            }
+        }
+    )
+
+
 # ====================
 # Event Selection Schemas
 # ====================
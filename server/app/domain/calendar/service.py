@@ -4,13 +4,15 @@
 캘린더 연동 및 이벤트 동기화의 비즈니스 로직을 담당합니다.
 """
 
-from datetime import datetime, timedelta
+import asyncio
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any
+import time
 import uuid
 
-from google.oauth2.credentials import Credentials
-from google.auth.transport.requests import Request
+import httpx
 from google_auth_oauthlib.flow import Flow
+from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from server.app.core.config import settings
@@ -20,7 +22,9 @@ from server.app.domain.calendar.models.calendar_event import CalendarEvent
 from server.app.domain.calendar.repositories.calendar_repository import (
     CalendarConnectionRepository,
     CalendarEventRepository,
+    CalendarSyncJobRepository,
 )
+from server.app.domain.calendar.models.calendar_sync_job import CalendarSyncJob
 from server.app.domain.calendar.calculators.event_filter_calculator import (
     EventFilterCalculator,
 )
@@ -29,16 +33,153 @@ from server.app.domain.calendar.formatters.calendar_formatter import (
 )
 from server.app.domain.calendar.utils.google_calendar_client import (
     GoogleCalendarClient,
+    refresh_access_token,
 )
 from server.app.domain.calendar.schemas.calendar import (
     CalendarConnectionResponse,
     CalendarEventListResponse,
+    CalendarSyncJobResponse,
     CalendarSyncResponse,
     EventSelectionResponse,
 )
 
 logger = get_logger(__name__)
 
+# OAuth 코드 교환에 쓰는 클라이언트 설정 — 내용이 settings로 고정이므로
+# 요청마다 dict를 새로 조립하지 않고 모듈 로드 시 한 번만 만듭니다
+_OAUTH_CLIENT_CONFIG = {
+    "web": {
+        "client_id": settings.GOOGLE_CLIENT_ID,
+        "client_secret": settings.GOOGLE_CLIENT_SECRET,
+        "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+        "token_uri": "https://oauth2.googleapis.com/token",
+    }
+}
+
+# ====================
+# 연동 상태 캐시
+# ====================
+# GET /calendar/connection은 거의 변하지 않는 값을 매 요청 재조회하는
+# 핫 경로라 user_id 기준 짧은 TTL 캐시로 DB 왕복을 생략합니다.
+# 응답에는 토큰이 포함되지 않으므로 프로세스 메모리에 둬도 안전합니다.
+_CONNECTION_CACHE_TTL_SECONDS = 60
+_CONNECTION_CACHE_MAX_ENTRIES = 10_000
+
+# user_id -> (만료 시각(monotonic), 응답)
+_connection_cache: dict[int, tuple[float, CalendarConnectionResponse]] = {}
+
+
+def _get_cached_connection(user_id: int) -> CalendarConnectionResponse | None:
+    """TTL이 남아 있으면 캐시된 연동 응답 반환"""
+    entry = _connection_cache.get(user_id)
+    if entry is None:
+        return None
+    expires_at, response = entry
+    if time.monotonic() >= expires_at:
+        _connection_cache.pop(user_id, None)
+        return None
+    return response
+
+
+def _cache_connection(user_id: int, response: CalendarConnectionResponse) -> None:
+    """연동 응답을 캐시에 저장 (가득 차면 전체 비움)"""
+    if len(_connection_cache) >= _CONNECTION_CACHE_MAX_ENTRIES:
+        _connection_cache.clear()
+    _connection_cache[user_id] = (
+        time.monotonic() + _CONNECTION_CACHE_TTL_SECONDS,
+        response,
+    )
+
+
+def _invalidate_connection_cache(user_id: int) -> None:
+    """연동 생성/해제 시 캐시 무효화"""
+    _connection_cache.pop(user_id, None)
+
+
+# ====================
+# 토큰 갱신 중복 제거
+# ====================
+# 같은 연동의 갱신 요청이 동시에 들어오면 모두가 OAuth 왕복을 따로
+# 치르고 같은 DB 행을 놓고 경합합니다. 진행 중인 갱신을 connection.id
+# 기준으로 공유해 첫 호출만 실제 갱신을 수행하고 나머지는 그 결과를
+# 기다립니다.
+
+_refresh_guard = asyncio.Lock()
+# connection.id -> (access_token, 새 refresh_token 또는 None, 만료 시각) Future
+_refresh_in_flight: dict[int, asyncio.Future] = {}
+
+# 이 개수 이상의 배치는 파싱을 워커 스레드로 내립니다
+# (작은 배치는 스레드 디스패치 비용이 파싱 비용보다 큼)
+_PARSE_OFFLOAD_THRESHOLD = 50
+
+# 동기화 시 페이지당 최대 이벤트 수 — 페이지 단위로 파싱·업서트하므로
+# 메모리 사용량은 이 크기에 비례해 제한됩니다
+_SYNC_PAGE_SIZE = 100
+
+
+def _parse_google_events(
+    google_events: List[Dict[str, Any]],
+    connection_id: int,
+    filter_calculator: EventFilterCalculator,
+) -> tuple[List[Dict[str, Any]], int]:
+    """
+    구글 이벤트 배치를 업서트용 행 목록으로 변환 (순수 CPU 작업)
+
+    datetime 파싱과 1on1 필터 판단만 수행하며 DB/네트워크를 건드리지
+    않으므로 asyncio.to_thread로 안전하게 내릴 수 있습니다.
+
+    Args:
+        google_events: 구글 캘린더 API 이벤트 목록
+        connection_id: 캘린더 연동 ID
+        filter_calculator: 1on1 필터 계산기
+
+    Returns:
+        tuple: (업서트용 행 목록, 필터링된 이벤트 수)
+    """
+    filtered_count = 0
+    rows: List[Dict[str, Any]] = []
+
+    for google_event in google_events:
+        summary = google_event.get("summary", "")
+        description = google_event.get("description", "")
+
+        # 참석자 정보 추출
+        attendees_count, attendees_emails = GoogleCalendarClient.extract_attendees(
+            google_event
+        )
+
+        # 필터링 여부 판단
+        is_filtered = filter_calculator.is_one_on_one_event(
+            summary=summary,
+            description=description,
+            attendees_count=attendees_count,
+        )
+
+        if is_filtered:
+            filtered_count += 1
+
+        rows.append(
+            {
+                "calendar_connection_id": connection_id,
+                "google_event_id": google_event.get("id"),
+                "summary": summary,
+                "description": description,
+                "start_time": GoogleCalendarClient.parse_event_datetime(
+                    google_event.get("start", {})
+                ),
+                "end_time": GoogleCalendarClient.parse_event_datetime(
+                    google_event.get("end", {})
+                ),
+                "location": google_event.get("location"),
+                "attendees_count": attendees_count,
+                "attendees_emails": attendees_emails,
+                "is_filtered": is_filtered,
+                "is_selected": False,
+            }
+        )
+
+    return rows, filtered_count
+
 
 class CalendarService:
     """
@@ -55,8 +196,39 @@ class CalendarService:
         self.db = db
         self.connection_repo = CalendarConnectionRepository(db)
         self.event_repo = CalendarEventRepository(db)
+        self.sync_job_repo = CalendarSyncJobRepository(db)
         self.filter_calculator = EventFilterCalculator()
         self.formatter = CalendarEventFormatter()
+        # 요청 범위 메모 — 서비스 인스턴스는 요청마다 새로 만들어지므로
+        # 같은 요청 안에서 반복되는 연동 조회를 SELECT 한 번으로 줄입니다
+        self._connection_memo: dict[int, CalendarConnection] = {}
+
+    async def _find_connection(
+        self,
+        user_id: int,
+    ) -> CalendarConnection | None:
+        """
+        사용자의 primary 연동 조회 (요청 범위 메모이즈)
+
+        한 요청이 ETag 계산과 목록 조회처럼 연동을 여러 번 해석하는
+        경우 첫 조회 결과를 재사용합니다.
+
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            Optional[CalendarConnection]: 캘린더 연동 정보
+        """
+        if user_id in self._connection_memo:
+            return self._connection_memo[user_id]
+
+        connection = await self.connection_repo.find_by_user_id(
+            user_id=user_id,
+            calendar_id="primary",
+        )
+        if connection is not None:
+            self._connection_memo[user_id] = connection
+        return connection
 
     async def create_connection(
         self,
@@ -79,14 +251,7 @@ class CalendarService:
 
         # OAuth 토큰 교환
         flow = Flow.from_client_config(
-            {
-                "web": {
-                    "client_id": settings.GOOGLE_CLIENT_ID,
-                    "client_secret": settings.GOOGLE_CLIENT_SECRET,
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                }
-            },
+            _OAUTH_CLIENT_CONFIG,
             scopes=GoogleCalendarClient.SCOPES,
             redirect_uri=redirect_uri,
         )
@@ -100,9 +265,8 @@ class CalendarService:
             calendar_id="primary",
         )
 
-        token_expires_at = datetime.utcnow() + timedelta(
-            seconds=credentials.expiry.timestamp() - datetime.utcnow().timestamp()
-        )
+        # 구글 라이브러리의 expiry는 naive UTC — tz만 붙이면 그대로 만료 시각
+        token_expires_at = credentials.expiry.replace(tzinfo=timezone.utc)
 
         if existing_connection:
             # 기존 연동 업데이트
@@ -125,6 +289,7 @@ class CalendarService:
             connection = await self.connection_repo.create(connection)
 
         await self.db.commit()
+        _invalidate_connection_cache(user_id)
 
         logger.info(f"Calendar connection created: {connection.id}")
         return self.formatter.format_connection(connection)
@@ -147,17 +312,21 @@ class CalendarService:
         """
         logger.info(f"Getting calendar connection for user: {user_id}")
 
+        # 캐시 확인 — TTL 내에는 DB 왕복 없이 응답
+        cached = _get_cached_connection(user_id)
+        if cached is not None:
+            return cached
+
         # 캘린더 연동 조회
-        connection = await self.connection_repo.find_by_user_id(
-            user_id=user_id,
-            calendar_id="primary",
-        )
+        connection = await self._find_connection(user_id)
 
         if not connection:
             raise ValueError("No calendar connection found for this user")
 
         logger.info(f"Calendar connection found: {connection.id}")
-        return self.formatter.format_connection(connection)
+        response = self.formatter.format_connection(connection)
+        _cache_connection(user_id, response)
+        return response
 
     async def delete_connection(
         self,
@@ -175,10 +344,7 @@ class CalendarService:
         logger.info(f"Deleting calendar connection for user: {user_id}")
 
         # 캘린더 연동 조회
-        connection = await self.connection_repo.find_by_user_id(
-            user_id=user_id,
-            calendar_id="primary",
-        )
+        connection = await self._find_connection(user_id)
 
         if not connection:
             raise ValueError("No calendar connection found for this user")
@@ -190,9 +356,65 @@ class CalendarService:
         await self.connection_repo.delete(connection.id)
 
         await self.db.commit()
+        _invalidate_connection_cache(user_id)
 
         logger.info(f"Calendar connection deleted: {connection.id}")
 
+    async def create_sync_job(
+        self,
+        user_id: int,
+    ) -> CalendarSyncJobResponse:
+        """
+        동기화 작업 생성 (실제 실행은 백그라운드에서)
+
+        활성 연동이 있는지 먼저 확인하고 pending 상태의 작업 행을 만들어
+        즉시 돌려줍니다. 요청 핸들러는 이 ID로 202를 응답합니다.
+
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            CalendarSyncJobResponse: 생성된 작업 정보
+
+        Raises:
+            ValueError: 활성 연동 정보가 없는 경우
+        """
+        connection = await self._find_connection(user_id)
+
+        if not connection or not connection.is_active:
+            raise ValueError("No active calendar connection found")
+
+        job = await self.sync_job_repo.create(user_id=user_id)
+        await self.db.commit()
+
+        logger.info(f"Sync job created: {job.id} for user: {user_id}")
+        return CalendarSyncJobResponse.model_validate(job)
+
+    async def get_sync_job(
+        self,
+        user_id: int,
+        job_id: int,
+    ) -> CalendarSyncJobResponse:
+        """
+        동기화 작업 상태 조회
+
+        Args:
+            user_id: 사용자 ID
+            job_id: 작업 ID
+
+        Returns:
+            CalendarSyncJobResponse: 작업 상태
+
+        Raises:
+            ValueError: 작업이 없거나 다른 사용자의 작업인 경우
+        """
+        job = await self.sync_job_repo.find_by_id(job_id)
+
+        if not job or job.user_id != user_id:
+            raise ValueError(f"Sync job not found: {job_id}")
+
+        return CalendarSyncJobResponse.model_validate(job)
+
     async def sync_events(
         self,
         user_id: int,
@@ -215,10 +437,7 @@ class CalendarService:
         logger.info(f"Syncing calendar events for user: {user_id}")
 
         # 캘린더 연동 조회
-        connection = await self.connection_repo.find_by_user_id(
-            user_id=user_id,
-            calendar_id="primary",
-        )
+        connection = await self._find_connection(user_id)
 
         if not connection or not connection.is_active:
             raise ValueError("No active calendar connection found")
@@ -233,86 +452,72 @@ class CalendarService:
             token_expires_at=connection.token_expires_at,
         )
 
-        # 이벤트 조회
-        google_events = client.list_events(
-            calendar_id="primary",
-            time_min=time_min,
-            time_max=time_max,
-            max_results=max_results,
-        )
-
-        # 이벤트 동기화
+        # 이벤트 동기화 — 전체 결과를 메모리에 쌓지 않고 페이지 단위로
+        # 조회·파싱·업서트를 반복합니다. 페이지당 DB 왕복은 기존 ID 조회와
+        # 배치 업서트 2회뿐이고, 파싱은 배치가 크면 워커 스레드로 내립니다
         synced_count = 0
-        new_count = 0
-        updated_count = 0
         filtered_count = 0
+        updated_count = 0
+        page_token: str | None = None
+        retried_auth = False
+
+        while True:
+            try:
+                google_events, page_token = await client.list_events_page(
+                    calendar_id="primary",
+                    time_min=time_min,
+                    time_max=time_max,
+                    page_size=min(max_results - synced_count, _SYNC_PAGE_SIZE),
+                    page_token=page_token,
+                )
+            except httpx.HTTPStatusError as error:
+                # 만료 검사와 실제 호출 사이에 토큰이 폐기됐을 수 있음 —
+                # 강제 갱신 후 같은 페이지를 한 번만 재시도
+                if error.response.status_code == 401 and not retried_auth:
+                    retried_auth = True
+                    logger.warning(
+                        f"Google API returned 401 for connection "
+                        f"{connection.id}; forcing token refresh and retrying"
+                    )
+                    await self._force_refresh(connection)
+                    client = GoogleCalendarClient(
+                        access_token=connection.access_token,
+                        refresh_token=connection.refresh_token,
+                        token_expires_at=connection.token_expires_at,
+                    )
+                    continue
+                raise
+
+            if len(google_events) >= _PARSE_OFFLOAD_THRESHOLD:
+                rows, page_filtered = await asyncio.to_thread(
+                    _parse_google_events,
+                    google_events,
+                    connection.id,
+                    self.filter_calculator,
+                )
+            else:
+                rows, page_filtered = _parse_google_events(
+                    google_events, connection.id, self.filter_calculator
+                )
 
-        for google_event in google_events:
-            google_event_id = google_event.get("id")
-            summary = google_event.get("summary", "")
-            description = google_event.get("description", "")
-
-            # 시작/종료 시간 파싱
-            start_time = GoogleCalendarClient.parse_event_datetime(
-                google_event.get("start", {})
-            )
-            end_time = GoogleCalendarClient.parse_event_datetime(
-                google_event.get("end", {})
-            )
-
-            # 참석자 정보 추출
-            attendees_count, attendees_emails = GoogleCalendarClient.extract_attendees(
-                google_event
+            # 신규/갱신 구분은 업서트 전에 기존 ID 집합 조회 한 번으로 계산
+            existing_ids = await self.event_repo.find_existing_google_event_ids(
+                connection_id=connection.id,
+                google_event_ids=[row["google_event_id"] for row in rows],
             )
 
-            # 필터링 여부 판단
-            is_filtered = self.filter_calculator.is_one_on_one_event(
-                summary=summary,
-                description=description,
-                attendees_count=attendees_count,
+            synced_count += len(rows)
+            filtered_count += page_filtered
+            updated_count += sum(
+                1 for row in rows if row["google_event_id"] in existing_ids
             )
 
-            if is_filtered:
-                filtered_count += 1
-
-            # 기존 이벤트 확인
-            existing_event = await self.event_repo.find_by_google_event_id(
-                connection_id=connection.id,
-                google_event_id=google_event_id,
-            )
+            await self.event_repo.bulk_upsert(rows)
 
-            if existing_event:
-                # 기존 이벤트 업데이트
-                existing_event.summary = summary
-                existing_event.description = description
-                existing_event.start_time = start_time
-                existing_event.end_time = end_time
-                existing_event.location = google_event.get("location")
-                existing_event.attendees_count = attendees_count
-                existing_event.attendees_emails = attendees_emails
-                existing_event.is_filtered = is_filtered
-
-                await self.event_repo.update(existing_event)
-                updated_count += 1
-            else:
-                # 새 이벤트 생성
-                event = CalendarEvent(
-                    calendar_connection_id=connection.id,
-                    google_event_id=google_event_id,
-                    summary=summary,
-                    description=description,
-                    start_time=start_time,
-                    end_time=end_time,
-                    location=google_event.get("location"),
-                    attendees_count=attendees_count,
-                    attendees_emails=attendees_emails,
-                    is_filtered=is_filtered,
-                    is_selected=False,
-                )
-                await self.event_repo.create(event)
-                new_count += 1
+            if not page_token or synced_count >= max_results:
+                break
 
-            synced_count += 1
+        new_count = synced_count - updated_count
 
         await self.db.commit()
 
@@ -334,6 +539,9 @@ class CalendarService:
         user_id: int,
         is_filtered: bool | None = None,
         is_selected: bool | None = None,
+        limit: int | None = None,
+        cursor_start_time: datetime | None = None,
+        cursor_id: int | None = None,
     ) -> CalendarEventListResponse:
         """
         캘린더 이벤트 목록 조회
@@ -342,6 +550,9 @@ class CalendarService:
             user_id: 사용자 ID
             is_filtered: 필터링 여부
             is_selected: 선택 여부
+            limit: 페이지 크기 (None이면 전체)
+            cursor_start_time: 키셋 커서 — 이전 페이지 마지막 행의 start_time
+            cursor_id: 키셋 커서 — 이전 페이지 마지막 행의 id
 
         Returns:
             CalendarEventListResponse: 이벤트 목록
@@ -349,37 +560,71 @@ class CalendarService:
         logger.info(f"Listing calendar events for user: {user_id}")
 
         # 캘린더 연동 조회
-        connection = await self.connection_repo.find_by_user_id(
-            user_id=user_id,
-            calendar_id="primary",
-        )
+        connection = await self._find_connection(user_id)
 
         if not connection:
             raise ValueError("No calendar connection found")
 
-        # 이벤트 조회
-        events = await self.event_repo.find_by_connection_id(
+        # 이벤트 조회 — 응답에 쓰는 컬럼만 Row로 가져와 ORM 수화를 생략
+        events = await self.event_repo.find_rows_for_listing(
             connection_id=connection.id,
             is_filtered=is_filtered,
             is_selected=is_selected,
+            limit=limit,
+            cursor_start_time=cursor_start_time,
+            cursor_id=cursor_id,
         )
 
-        # 통계 계산
-        total = await self.event_repo.count_by_connection_id(connection.id)
-        filtered_count = await self.event_repo.count_by_connection_id(
-            connection.id, is_filtered=True
-        )
-        selected_count = await self.event_repo.count_by_connection_id(
-            connection.id, is_selected=True
-        )
+        # 통계 계산 — 필터·페이지네이션 없는 조회면 이미 전체 행을 들고
+        # 있으므로 추가 쿼리 없이 메모리에서 집계하고, 아니면 집계 쿼리 1회
+        if (
+            is_filtered is None
+            and is_selected is None
+            and limit is None
+            and cursor_start_time is None
+        ):
+            total = len(events)
+            filtered_count = sum(1 for event in events if event.is_filtered)
+            selected_count = sum(1 for event in events if event.is_selected)
+        else:
+            total, filtered_count, selected_count = await self.event_repo.count_summary(
+                connection.id
+            )
 
-        return CalendarEventListResponse(
+        # 내부에서 만든 신뢰 가능한 값이므로 외부 모델도 검증 없이 조립
+        return CalendarEventListResponse.model_construct(
             events=self.formatter.format_events(events),
             total=total,
             filtered_count=filtered_count,
             selected_count=selected_count,
         )
 
+    async def get_events_etag(
+        self,
+        user_id: int,
+    ) -> tuple[datetime | None, int]:
+        """
+        이벤트 목록의 변경 마커 조회 (조건부 GET용)
+
+        목록 전체를 만들지 않고도 "마지막 응답 이후 바뀌었는가"를
+        판단할 수 있도록 (MAX(updated_at), COUNT(*))를 돌려줍니다.
+
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            tuple: (마지막 수정 시각, 전체 이벤트 개수)
+
+        Raises:
+            ValueError: 연동 정보가 없는 경우
+        """
+        connection = await self._find_connection(user_id)
+
+        if not connection:
+            raise ValueError("No calendar connection found")
+
+        return await self.event_repo.change_marker(connection.id)
+
     async def get_event(
         self,
         user_id: int,
@@ -401,10 +646,7 @@ class CalendarService:
         logger.info(f"Getting calendar event {event_id} for user: {user_id}")
 
         # 캘린더 연동 조회
-        connection = await self.connection_repo.find_by_user_id(
-            user_id=user_id,
-            calendar_id="primary",
-        )
+        connection = await self._find_connection(user_id)
 
         if not connection:
             raise ValueError("No calendar connection found")
@@ -439,19 +681,21 @@ class CalendarService:
         """
         logger.info(f"Selecting calendar events for user: {user_id}")
 
-        # 이벤트 선택 상태 업데이트
-        await self.event_repo.update_selection_status(
+        # 이벤트 선택 상태 업데이트 — 소유권 검증을 포함한 일괄 UPDATE로
+        # 실제 반영된 행만 응답에 담습니다
+        updated_ids = await self.event_repo.bulk_set_selection(
+            user_id=user_id,
             event_ids=event_ids,
             is_selected=True,
         )
 
         await self.db.commit()
 
-        logger.info(f"Selected {len(event_ids)} events")
+        logger.info(f"Selected {len(updated_ids)} events")
 
         return EventSelectionResponse(
-            selected_count=len(event_ids),
-            event_ids=event_ids,
+            selected_count=len(updated_ids),
+            event_ids=updated_ids,
         )
 
     async def deselect_events(
@@ -471,19 +715,21 @@ class CalendarService:
         """
         logger.info(f"Deselecting calendar events for user: {user_id}")
 
-        # 이벤트 선택 상태 업데이트
-        await self.event_repo.update_selection_status(
+        # 이벤트 선택 상태 업데이트 — 소유권 검증을 포함한 일괄 UPDATE로
+        # 실제 반영된 행만 응답에 담습니다
+        updated_ids = await self.event_repo.bulk_set_selection(
+            user_id=user_id,
             event_ids=event_ids,
             is_selected=False,
         )
 
         await self.db.commit()
 
-        logger.info(f"Deselected {len(event_ids)} events")
+        logger.info(f"Deselected {len(updated_ids)} events")
 
         return EventSelectionResponse(
-            selected_count=0,
-            event_ids=event_ids,
+            selected_count=len(updated_ids),
+            event_ids=updated_ids,
         )
 
     async def _refresh_token_if_needed(
@@ -491,34 +737,229 @@ class CalendarService:
         connection: CalendarConnection,
     ) -> None:
         """
-        필요시 토큰 갱신
+        하드 만료된 경우에만 토큰 갱신 (폴백 경로)
+
+        선제 갱신은 token_refresh_loop가 만료 15분 전부터 백그라운드로
+        처리하므로, 요청 경로에서는 루프가 놓친 만료 직전/직후 토큰만
+        동기화 직전에 갱신합니다. 덕분에 대부분의 동기화 요청은 OAuth
+        왕복 없이 바로 구글 API를 호출합니다.
 
         Args:
             connection: 캘린더 연동 정보
         """
-        # 토큰이 만료되었거나 10분 이내에 만료될 경우 갱신
-        if connection.token_expires_at < datetime.utcnow() + timedelta(minutes=10):
-            logger.info(f"Refreshing token for connection: {connection.id}")
+        # 리프레시 토큰이 없으면 갱신 자체가 불가 — OAuth 왕복을 시도하지
+        # 않고 만료된 액세스 토큰으로 호출해 구글의 401을 그대로 받습니다
+        if not connection.refresh_token:
+            logger.warning(
+                f"Connection {connection.id} has no refresh token; "
+                "re-authorization required"
+            )
+            return
+
+        # TIMESTAMPTZ 컬럼은 aware로 돌아오므로 naive utcnow()와 비교 불가
+        # 1분 여유는 갱신 직후 API 호출이 만료 경계를 넘지 않게 하는 스큐 버퍼
+        if connection.token_expires_at >= datetime.now(timezone.utc) + timedelta(minutes=1):
+            return
 
-            credentials = Credentials(
-                token=connection.access_token,
-                refresh_token=connection.refresh_token,
-                token_uri="https://oauth2.googleapis.com/token",
-                client_id=settings.GOOGLE_CLIENT_ID,
-                client_secret=settings.GOOGLE_CLIENT_SECRET,
+        await self._force_refresh(connection)
+
+    async def _force_refresh(
+        self,
+        connection: CalendarConnection,
+    ) -> None:
+        """
+        만료 여부와 무관하게 토큰 갱신
+
+        서버 측에서 토큰이 폐기되어 만료 시각상 유효한데도 401이
+        돌아오는 경우를 위해 만료 검사 없이 갱신합니다.
+
+        Args:
+            connection: 캘린더 연동 정보
+        """
+        if not connection.refresh_token:
+            logger.warning(
+                f"Connection {connection.id} has no refresh token; "
+                "re-authorization required"
             )
+            return
 
-            credentials.refresh(Request())
+        # 같은 연동의 갱신이 이미 진행 중이면 OAuth 왕복 없이 결과만 공유
+        async with _refresh_guard:
+            future = _refresh_in_flight.get(connection.id)
+            is_owner = future is None
+            if is_owner:
+                future = asyncio.get_running_loop().create_future()
+                _refresh_in_flight[connection.id] = future
 
-            # 토큰 업데이트
-            connection.access_token = credentials.token
-            if credentials.refresh_token:
-                connection.refresh_token = credentials.refresh_token
-            connection.token_expires_at = datetime.utcnow() + timedelta(
-                seconds=credentials.expiry.timestamp() - datetime.utcnow().timestamp()
+        if is_owner:
+            logger.info(f"Refreshing token for connection: {connection.id}")
+            try:
+                result = await refresh_access_token(connection.refresh_token)
+                future.set_result(result)
+            except Exception as e:
+                future.set_exception(e)
+                # 대기자가 없어도 "exception never retrieved" 경고가 남지 않도록
+                future.exception()
+                raise
+            finally:
+                async with _refresh_guard:
+                    _refresh_in_flight.pop(connection.id, None)
+            access_token, new_refresh_token, expires_at = result
+        else:
+            logger.info(
+                f"Awaiting in-flight token refresh for connection: {connection.id}"
             )
+            access_token, new_refresh_token, expires_at = await future
 
+        # 토큰 업데이트 — 대기자도 자기 세션의 객체에 새 값을 반영합니다
+        connection.access_token = access_token
+        if new_refresh_token:
+            connection.refresh_token = new_refresh_token
+        connection.token_expires_at = expires_at
+
+        # DB 반영은 실제 갱신을 수행한 호출만 (대기자의 값은 동일)
+        if is_owner:
             await self.connection_repo.update(connection)
             await self.db.commit()
-
             logger.info(f"Token refreshed for connection: {connection.id}")
+
+
+async def run_sync_job(
+    job_id: int,
+    user_id: int,
+    time_min: datetime | None = None,
+    time_max: datetime | None = None,
+    max_results: int = 100,
+) -> None:
+    """
+    동기화 작업 백그라운드 실행
+
+    요청 핸들러가 202를 돌려준 뒤 별도 세션으로 실행됩니다. 구글 API
+    왕복과 대량 쓰기가 요청 세션(및 풀 슬롯)을 붙잡지 않도록 자체
+    세션을 열고, 결과/오류는 작업 행에 기록해 폴링으로 조회합니다.
+
+    Args:
+        job_id: 동기화 작업 ID
+        user_id: 사용자 ID
+        time_min: 조회 시작 시간
+        time_max: 조회 종료 시간
+        max_results: 최대 조회 개수
+    """
+    # 요청 수명과 분리된 전용 세션 (지연 import로 순환 참조 방지)
+    from server.app.core.database import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        job_repo = CalendarSyncJobRepository(db)
+        await job_repo.mark_running(job_id)
+        await db.commit()
+
+        try:
+            service = CalendarService(db)
+            result = await service.sync_events(
+                user_id=user_id,
+                time_min=time_min,
+                time_max=time_max,
+                max_results=max_results,
+            )
+        except Exception as e:
+            logger.error(f"Sync job {job_id} failed: {e}")
+            await db.rollback()
+            await job_repo.mark_failed(job_id, str(e))
+            await db.commit()
+            return
+
+        await job_repo.mark_completed(
+            job_id,
+            synced_count=result.synced_count,
+            filtered_count=result.filtered_count,
+            new_count=result.new_count,
+            updated_count=result.updated_count,
+        )
+        await db.commit()
+        logger.info(f"Sync job {job_id} completed")
+
+
+# ====================
+# 선제 토큰 갱신
+# ====================
+# 동기화 요청 경로에서 OAuth 왕복을 치르는 대신, 만료가 임박한 토큰을
+# 백그라운드 루프가 미리 갱신해 둡니다. 요청 경로의 인라인 갱신은
+# 하드 만료만 처리하는 폴백으로 남습니다.
+
+# 스캔 주기 — 갱신 버퍼(TOKEN_REFRESH_BUFFER_SECONDS)보다 충분히 짧아
+# 갱신 기회를 놓치지 않습니다
+_TOKEN_REFRESH_SCAN_INTERVAL_SECONDS = 120
+
+
+async def refresh_expiring_tokens() -> int:
+    """
+    만료 임박 토큰 일괄 선제 갱신 (스캔 1회)
+
+    활성 연동 중 만료까지 버퍼 이내로 남은 토큰을 찾아 갱신합니다.
+    개별 연동의 갱신 실패는 기록만 하고 다음 연동으로 넘어갑니다
+    (해당 연동은 요청 경로의 하드 만료 폴백이 재시도).
+
+    Returns:
+        int: 갱신된 연동 수
+    """
+    # 요청 수명과 분리된 전용 세션 (지연 import로 순환 참조 방지)
+    from server.app.core.database import AsyncSessionLocal
+
+    refreshed = 0
+
+    buffer = timedelta(seconds=settings.TOKEN_REFRESH_BUFFER_SECONDS)
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(CalendarConnection).where(
+                and_(
+                    CalendarConnection.is_active == True,  # noqa: E712
+                    # 리프레시 토큰이 없는 연동은 갱신 불가 — 재연동 대상
+                    CalendarConnection.refresh_token != "",
+                    CalendarConnection.token_expires_at
+                    < datetime.now(timezone.utc) + buffer,
+                )
+            )
+        )
+        connections = result.scalars().all()
+
+        for connection in connections:
+            try:
+                access_token, new_refresh_token, expires_at = (
+                    await refresh_access_token(connection.refresh_token)
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Proactive token refresh failed for connection "
+                    f"{connection.id}: {e}"
+                )
+                continue
+
+            connection.access_token = access_token
+            if new_refresh_token:
+                connection.refresh_token = new_refresh_token
+            connection.token_expires_at = expires_at
+            refreshed += 1
+
+        await db.commit()
+
+    if refreshed:
+        logger.info(f"Proactively refreshed {refreshed} calendar tokens")
+    return refreshed
+
+
+async def token_refresh_loop() -> None:
+    """
+    선제 토큰 갱신 주기 루프
+
+    애플리케이션 시작 시 asyncio 태스크로 띄워지고 종료 시 취소됩니다.
+    스캔 중 오류가 나도 루프는 살아서 다음 주기에 재시도합니다.
+    """
+    while True:
+        try:
+            await refresh_expiring_tokens()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Token refresh scan failed: {e}")
+        await asyncio.sleep(_TOKEN_REFRESH_SCAN_INTERVAL_SECONDS)
@@ -37,7 +37,7 @@ class OneOnOneSession(Base):
     manager_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     
     topic: Mapped[str] = mapped_column(String(200), nullable=False)
-    status: Mapped[str] = mapped_column(String(20), default="scheduled") # scheduled, completed, cancelled
+    status: Mapped[str] = mapped_column(String(20), default="scheduled") # scheduled, processing, completed, failed, cancelled
     scheduled_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     
     report_data: Mapped[Optional[str]] = mapped_column(Text, nullable=True) # JSON or Text content
@@ -30,4 +30,5 @@ class AnalysisResponse(BaseModel):
 
 class ReportResponse(BaseModel):
     session_id: int
-    report: Any # This will hold the JSON from ManagerReportResponse or MemberReportResponse
+    status: str  # processing/completed/failed 등 세션 상태
+    report: Optional[Any] = None # This will hold the JSON from ManagerReportResponse or MemberReportResponse
@@ -1,9 +1,12 @@
 import asyncio
-import json
+import hashlib
+import itertools
 import os
+import time
 from typing import List, Optional
 from datetime import datetime
 
+import orjson
 from fastapi import UploadFile
 from openai import AsyncOpenAI
 from sqlalchemy import select
@@ -29,6 +32,70 @@ from server.app.formatters.report_formatter import ReportFormatter
 
 logger = get_logger(__name__)
 
+# Content-addressed Whisper cache: retries and reprocessing of the same
+# audio skip the paid, multi-second STT round trip entirely.
+_WHISPER_CACHE_DIR = "whisper_cache"
+# Full-report cache keyed on (audio digest, goal text): the calculator
+# pipeline is deterministic given those inputs, so a hit skips STT and
+# every LLM call, not just the transcription.
+_REPORT_CACHE_DIR = "report_cache"
+_WHISPER_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+
+def _read_file_bytes(file_path: str) -> bytes:
+    """Read a whole file; meant to run via asyncio.to_thread."""
+    with open(file_path, "rb") as f:
+        return f.read()
+
+
+def _audio_digest(file_path: str) -> str:
+    """SHA-256 of the audio file, read in 1MB chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _load_cached_json(cache_dir: str, key: str) -> Optional[dict]:
+    """Return the cached entry for this key from cache_dir, or None."""
+    path = os.path.join(cache_dir, f"{key}.json")
+    try:
+        if time.time() - os.path.getmtime(path) > _WHISPER_CACHE_TTL_SECONDS:
+            os.remove(path)
+            return None
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _store_cached_json(cache_dir: str, key: str, data: dict) -> None:
+    """Persist an entry under its key in cache_dir, pruning stale entries."""
+    os.makedirs(cache_dir, exist_ok=True)
+
+    # Cheap sweep: drop entries past the TTL so the dir stays bounded
+    cutoff = time.time() - _WHISPER_CACHE_TTL_SECONDS
+    try:
+        for name in os.listdir(cache_dir):
+            stale_path = os.path.join(cache_dir, name)
+            if os.path.getmtime(stale_path) < cutoff:
+                os.remove(stale_path)
+    except OSError:
+        pass
+
+    with open(os.path.join(cache_dir, f"{key}.json"), "wb") as f:
+        f.write(orjson.dumps(data))
+
+
+def _report_cache_key(audio_digest: str, goal_text: str) -> str:
+    """Cache key over everything the report deterministically depends on."""
+    return hashlib.blake2b(
+        audio_digest.encode() + b"\x1f" + goal_text.encode(),
+        digest_size=16,
+    ).hexdigest()
+
+
 class OneOnOneService:
     def __init__(
         self,
@@ -41,72 +108,161 @@ class OneOnOneService:
         self.formatter = formatter
         self.openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
 
-    async def analyze_audio(self, session_id: int, audio_file: UploadFile) -> str:
+    async def save_upload(self, session_id: int, audio_file: UploadFile) -> tuple[str, str]:
+        """
+        Stream an uploaded audio file to local temp storage.
+
+        Returns the saved file path and the SHA-256 digest of the payload,
+        both to be handed to analyze_audio. Hashing happens on the chunks
+        as they stream through, so the cache key costs no extra read of
+        the file afterwards.
         """
-        Analyze 1on1 session audio:
+        temp_dir = "temp_audio"
+        await asyncio.to_thread(os.makedirs, temp_dir, exist_ok=True)
+        file_path = f"{temp_dir}/{session_id}_{datetime.now().timestamp()}_{audio_file.filename}"
+
+        # Stream the upload to disk in chunks; audio files run tens of MB
+        # and a full read() would hold the whole payload in memory. The
+        # writes go through to_thread so a slow disk never stalls the
+        # event loop between chunks.
+        digest = hashlib.sha256()
+        buffer = await asyncio.to_thread(open, file_path, "wb")
+        try:
+            while chunk := await audio_file.read(1024 * 1024):
+                digest.update(chunk)
+                await asyncio.to_thread(buffer.write, chunk)
+        finally:
+            await asyncio.to_thread(buffer.close)
+
+        return file_path, digest.hexdigest()
+
+    async def mark_processing(self, session_id: int) -> None:
+        """
+        Mark a session as processing before its analysis job starts.
+
+        Raises:
+            ValueError: If the session does not exist
+        """
+        session = await self._get_session(session_id)
+        if not session:
+            raise ValueError(f"Session {session_id} not found")
+
+        session.status = "processing"
+        await self.session_repo.db.commit()
+
+    async def mark_failed(self, session_id: int) -> None:
+        """Mark a session as failed after its analysis job errored."""
+        session = await self._get_session(session_id)
+        if session:
+            session.status = "failed"
+            await self.session_repo.db.commit()
+
+    async def analyze_audio(
+        self, session_id: int, file_path: str, digest: Optional[str] = None
+    ) -> str:
+        """
+        Analyze 1on1 session audio from a saved file:
         1. STT using OpenAI Whisper
         2. Analyze using multiple Calculators
         3. Format and Save
+
+        The temp file is removed when the analysis finishes. Pass the
+        digest computed by save_upload to skip re-reading the file here.
         """
-        # 1. Save file locally (Temporary)
-        temp_dir = "temp_audio"
-        os.makedirs(temp_dir, exist_ok=True)
-        file_path = f"{temp_dir}/{session_id}_{datetime.now().timestamp()}_{audio_file.filename}"
-        
         try:
-            with open(file_path, "wb") as buffer:
-                content = await audio_file.read()
-                buffer.write(content)
-            
-            # 2. STT via Whisper
-            logger.info(f"Starting STT for session {session_id}")
-            with open(file_path, "rb") as f:
+            if digest is None:
+                digest = await asyncio.to_thread(_audio_digest, file_path)
+
+            # 1. Session and Goal context. Loaded first (a single indexed
+            # local query) because the report cache key depends on the goal.
+            session, goal_text = await self._load_context(session_id)
+            if not session:
+                raise ValueError(f"Session {session_id} not found")
+
+            # The full pipeline is deterministic in (audio, goal): on a
+            # report-cache hit, skip STT and every calculator/LLM call and
+            # just re-stamp the envelope with a fresh timestamp.
+            report_key = _report_cache_key(digest, goal_text)
+            cached_report = await asyncio.to_thread(
+                _load_cached_json, _REPORT_CACHE_DIR, report_key
+            )
+            if cached_report is not None:
+                logger.info(f"Report cache hit for session {session_id}")
+                session.report_data = self.formatter.combine_json_parts(
+                    cached_report["manager"],
+                    cached_report["member"],
+                    datetime.now().isoformat(),
+                )
+                session.status = "completed"
+                await self.session_repo.db.commit()
+                return session.report_data
+
+            # 2. STT via Whisper — keyed by audio content hash so retries and
+            # reprocessing of the same recording skip the paid STT call.
+            cached = await asyncio.to_thread(
+                _load_cached_json, _WHISPER_CACHE_DIR, digest
+            )
+
+            if cached is not None:
+                logger.info(f"Whisper cache hit for session {session_id}")
+                segments_raw = cached["segments"]
+                duration = cached["duration"]
+            else:
+                logger.info(f"Starting STT for session {session_id}")
+                # Read the payload off-thread; handing the SDK an open
+                # file object would make it do blocking reads on the loop
+                audio_bytes = await asyncio.to_thread(_read_file_bytes, file_path)
+
                 # We use verbose_json to get segment timestamps
                 transcription_response = await self.openai_client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=f,
+                    model=settings.WHISPER_MODEL,
+                    file=(os.path.basename(file_path), audio_bytes),
                     response_format="verbose_json"
                 )
-            
+
+                # Normalize to plain dicts so the cache round-trips losslessly
+                segments_raw = [
+                    {"text": seg.text, "start": seg.start, "end": seg.end}
+                    for seg in transcription_response.segments
+                ]
+                duration = transcription_response.duration
+
+                await asyncio.to_thread(_store_cached_json, _WHISPER_CACHE_DIR, digest, {
+                    "text": transcription_response.text,
+                    "duration": duration,
+                    "segments": segments_raw,
+                })
+
             # Whisper segments don't have speaker labels.
             # In a real production app, we would use a diarization model or LLM to label speakers.
             # For this task, we will simulate speaker labelling using LLM to make Calculators work.
-            raw_text = transcription_response.text
-            segments_raw = transcription_response.segments
-            
-            # TODO: Add Diarization logic if needed. 
+
+            # TODO: Add Diarization logic if needed.
             # For now, let's create WhisperTranscription object.
             # We'll distribute segments between manager/member arbitrarily or use LLM later.
             # Let's use a simple heuristic for demo or use LLM to diarize.
-            
-            labeled_segments = []
-            for i, seg in enumerate(segments_raw):
-                # Simple logic for now: alternate speakers if not provided
-                speaker = "manager" if i % 2 == 0 else "member"
-                labeled_segments.append(SpeechSegment(
+
+            # Simple logic for now: alternate speakers if not provided.
+            # cycle() hands out the two interned labels without the
+            # per-iteration modulo/branch, and the comprehension runs on
+            # the LIST_APPEND fast path. A real diarizer can later supply
+            # its own speakers iterable here unchanged.
+            speakers = itertools.cycle(("manager", "member"))
+            labeled_segments = [
+                SpeechSegment(
                     speaker=speaker,
-                    text=seg.text,
-                    start_time=seg.start,
-                    end_time=seg.end
-                ))
+                    text=seg["text"],
+                    start_time=seg["start"],
+                    end_time=seg["end"],
+                )
+                for speaker, seg in zip(speakers, segments_raw)
+            ]
 
             whisper_data = WhisperTranscription(
                 segments=labeled_segments,
-                total_duration=transcription_response.duration
+                total_duration=duration
             )
 
-            # 3. Load Session and Goal context
-            # We need the Goal of the member to check for Alignment.
-            session_stmt = select(OneOnOneSession).where(OneOnOneSession.id == session_id)
-            result = await self.session_repo.db.execute(session_stmt)
-            session = result.scalar_one_or_none()
-            
-            if not session:
-                raise ValueError(f"Session {session_id} not found")
-
-            goals = await self.goal_repo.get_by_user_id(session.user_id)
-            goal_text = goals[0].content if goals else "No specific goal provided."
-
             # 4. Run Calculators in Parallel
             logger.info(f"Running calculators for session {session_id}")
             
@@ -152,29 +308,101 @@ class OneOnOneService:
                 goal_res, speech_res, coaching_res
             )
 
-            final_report = {
-                "manager": manager_report.model_dump(),
-                "member": member_report.model_dump(),
-                "performed_at": datetime.now().isoformat()
-            }
-
             # 6. Save to Database
-            session.report_data = json.dumps(final_report, ensure_ascii=False)
+            # Each report is serialized once by pydantic-core; no
+            # intermediate model_dump() dicts to re-walk.
+            manager_json = manager_report.model_dump_json()
+            member_json = member_report.model_dump_json()
+            session.report_data = self.formatter.combine_json_parts(
+                manager_json,
+                member_json,
+                datetime.now().isoformat(),
+            )
             session.status = "completed"
             await self.session_repo.db.commit()
-            
+
+            # Persist the serialized reports (sans timestamp) so a re-run
+            # with the same audio and goal skips the whole pipeline.
+            await asyncio.to_thread(_store_cached_json, _REPORT_CACHE_DIR, report_key, {
+                "manager": manager_json,
+                "member": member_json,
+            })
+
             return session.report_data
 
         finally:
-            # Cleanup temp file
-            if os.path.exists(file_path):
-                os.remove(file_path)
+            # Cleanup temp file — catching FileNotFoundError instead of a
+            # prior exists() check halves the syscalls here
+            try:
+                await asyncio.to_thread(os.remove, file_path)
+            except FileNotFoundError:
+                pass
 
     async def get_report(self, session_id: int) -> Optional[dict]:
+        """
+        Return the session's report, or just its status while none exists.
+
+        Polling clients distinguish processing/failed from "never
+        analyzed" via the status field. None means the session itself
+        does not exist.
+        """
+        session = await self._get_session(session_id)
+        if session is None:
+            return None
+
+        payload: dict = {"session_id": session.id, "status": session.status}
+        if session.report_data:
+            payload["report"] = orjson.loads(session.report_data)
+        return payload
+
+    async def _load_context(
+        self, session_id: int
+    ) -> tuple[Optional[OneOnOneSession], str]:
+        """
+        Load the session and the member's goal text for analysis.
+
+        We need the Goal of the member to check for Alignment. A single
+        outer-joined statement fetches both in one round-trip.
+        """
+        stmt = (
+            select(OneOnOneSession, Goal.content)
+            .outerjoin(Goal, Goal.user_id == OneOnOneSession.user_id)
+            .where(OneOnOneSession.id == session_id)
+            .order_by(Goal.id)  # deterministic "first" goal
+            .limit(1)
+        )
+        result = await self.session_repo.db.execute(stmt)
+        row = result.first()
+        if row is None:
+            return None, ""
+
+        session, goal_content = row
+        return session, goal_content or "No specific goal provided."
+
+    async def _get_session(self, session_id: int) -> Optional[OneOnOneSession]:
         session_stmt = select(OneOnOneSession).where(OneOnOneSession.id == session_id)
         result = await self.session_repo.db.execute(session_stmt)
-        session = result.scalar_one_or_none()
-        
-        if session and session.report_data:
-            return json.loads(session.report_data)
-        return None
+        return result.scalar_one_or_none()
+
+
+async def run_analysis_job(
+    session_id: int, file_path: str, digest: Optional[str] = None
+) -> None:
+    """
+    Run a full audio analysis in the background.
+
+    Opens its own database session: the request-scoped session from get_db
+    is closed once the HTTP response is sent, before this job finishes.
+    """
+    from server.app.core.database import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        service = OneOnOneService(SessionRepository(db), GoalRepository(db), ReportFormatter())
+        try:
+            await service.analyze_audio(session_id, file_path, digest)
+        except Exception:
+            logger.exception(f"Background analysis failed for session {session_id}")
+            # A database error leaves the session in a pending-rollback
+            # state; roll back first so mark_failed's own queries can run.
+            await db.rollback()
+            await service.mark_failed(session_id)
@@ -1,13 +1,25 @@
 from datetime import datetime
 from typing import Optional, List
 
-from sqlalchemy import String, ForeignKey, Integer, DateTime, Text, func
+from sqlalchemy import String, ForeignKey, Index, Integer, DateTime, LargeBinary, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from server.app.core.database import Base
 
 class Department(Base):
     __tablename__ = "departments"
+    __table_args__ = (
+        # 루트 부서 조회(parent_id IS NULL)용 부분 고유 인덱스 — NULL 행만
+        # 담아 인덱스가 작고, 시딩/인증 경로의 루트 탐색이 인덱스 룩업이 됩니다.
+        # UNIQUE라서 "회사당 루트 하나" 불변식을 DB가 보장하며, 시딩의
+        # ON CONFLICT 중재 인덱스로도 쓰입니다.
+        Index(
+            "ix_departments_company_root",
+            "company_id",
+            unique=True,
+            postgresql_where=text("parent_id IS NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     company_id: Mapped[int] = mapped_column(ForeignKey("companies.id"), nullable=False, index=True)
@@ -35,7 +47,9 @@ class User(Base):
     profile_image: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
 
     # OAuth Token fields
-    refresh_token: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # 원문 JWT 대신 blake2b 해시(16바이트)만 저장 — 로우가 작아지고
+    # DB 덤프에서 토큰을 복원할 수 없습니다
+    refresh_token: Mapped[Optional[bytes]] = mapped_column(LargeBinary(16), nullable=True)
     refresh_token_expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
@@ -1,5 +1,6 @@
 from typing import Optional, List
 from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 from server.app.shared.base.repository import BaseRepository
 from server.app.domain.user.models.user import Department
 
@@ -11,18 +12,32 @@ class DepartmentRepository(BaseRepository[Department, Department]):
     async def get_by_company_id(self, company_id: int) -> List[Department]:
         """
         특정 회사의 모든 부서를 조회합니다.
+
+        children/users를 selectinload로 함께 적재하므로 호출부가 부서
+        트리를 순회해도 부서당 추가 SELECT(N+1) 없이 총 3개의 쿼리로
+        끝납니다.
         """
-        stmt = select(Department).where(Department.company_id == company_id)
+        stmt = (
+            select(Department)
+            .options(
+                selectinload(Department.children),
+                selectinload(Department.users),
+            )
+            .where(Department.company_id == company_id)
+        )
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
     async def get_root_department(self, company_id: int) -> Optional[Department]:
         """
         특정 회사의 최상위 부서(Root Department)를 조회합니다.
+
+        ix_departments_company_root 부분 인덱스(parent_id IS NULL)를 타는
+        인덱스 룩업이며, 루트는 하나뿐이므로 LIMIT 1로 플래너에 힌트를 줍니다.
         """
         stmt = select(Department).where(
             Department.company_id == company_id,
-            Department.parent_id == None
-        )
+            Department.parent_id.is_(None)
+        ).limit(1)
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
@@ -5,6 +5,8 @@ This module transforms raw analysis results from various calculators into
 JSON structures suitable for frontend visualization libraries (e.g., Recharts).
 """
 
+import hashlib
+import heapq
 from typing import Any, List, Optional
 
 from pydantic import BaseModel, Field
@@ -80,11 +82,36 @@ class MemberReportResponse(BaseModel):
 # Formatter Logic
 # ====================
 
+# Both format_* methods are pure functions of their calculator results, so
+# equal inputs (retries, reprocessing of cached transcriptions) can reuse the
+# built response. Keyed by a digest of the input models' JSON; cleared
+# wholesale when full. Cached responses are shared — treat them as read-only.
+_FORMAT_CACHE_MAX_ENTRIES = 256
+_format_cache: dict[str, Any] = {}
+
+
+def _format_cache_key(prefix: str, *parts: BaseModel) -> str:
+    """Stable digest of the formatter inputs."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.__pydantic_serializer__.to_json(part))
+        digest.update(b"\x1f")
+    return prefix + digest.hexdigest()
+
+
+def _format_cache_store(key: str, value: Any) -> Any:
+    """Store a formatted response (clearing the cache when full)."""
+    if len(_format_cache) >= _FORMAT_CACHE_MAX_ENTRIES:
+        _format_cache.clear()
+    _format_cache[key] = value
+    return value
+
+
 class ReportFormatter:
     """
     Transforms analysis results into UI-ready data structures.
     """
-    
+
     def format_manager_report(
         self,
         speech_result: SpeechAnalysisResult,
@@ -95,7 +122,13 @@ class ReportFormatter:
         """
         Create data for Manager's Coaching Mirror.
         """
-        
+        key = _format_cache_key(
+            "manager:", speech_result, style_result, safety_result, goal_result
+        )
+        cached = _format_cache.get(key)
+        if cached is not None:
+            return cached
+
         # 1. Construct Radar Chart Data (5 Core Skills)
         # Mapping logic:
         # - Listening: Based on Member's speaking ratio (ideal ~50-60%) and silence
@@ -130,14 +163,14 @@ class ReportFormatter:
         # Ideally, SpeechAnalysisResult should carry simplified timeline info.
         timeline_data = [] 
         
-        return ManagerReportResponse(
+        return _format_cache_store(key, ManagerReportResponse(
             radar_chart=radar_data,
             timeline_data=timeline_data,
             coaching_score=style_result.coaching_score,
             safety_score=safety_result.safety_score,
             talk_ratio=speech_result.manager_speaking_ratio,
             feedback=style_result.improvement_feedback
-        )
+        ))
 
     def format_member_report(
         self,
@@ -148,43 +181,88 @@ class ReportFormatter:
         """
         Create data for Member's Growth Mirror.
         """
-        
+        key = _format_cache_key(
+            "member:", goal_result, speech_result, style_result
+        )
+        cached = _format_cache.get(key)
+        if cached is not None:
+            return cached
+
         # 1. Word Cloud
-        # Combine goal keywords and matched topics
-        word_cloud = []
-        
+        # Combine goal keywords and matched topics, indexed by text so the
+        # matched-topic merge is a dict lookup instead of a linear scan
+        wc_by_text: dict[str, WordCloudItem] = {}
+
         # Add conversation keywords
         for kw in goal_result.conversation_keywords[:15]:
-            word_cloud.append(WordCloudItem(text=kw, value=30)) # Base weight
-            
+            wc_by_text[kw] = WordCloudItem(text=kw, value=30)  # Base weight
+
         # Highlight matched topics
         for topic in goal_result.matched_topics:
-            # Check if already added
-            existing = next((w for w in word_cloud if w.text == topic.keyword), None)
+            existing = wc_by_text.get(topic.keyword)
             if existing:
                 existing.value += 50  # Boost weight
             else:
-                word_cloud.append(WordCloudItem(text=topic.keyword, value=60))
-                
-        # Sort by value desc
-        word_cloud.sort(key=lambda x: x.value, reverse=True)
-        
+                wc_by_text[topic.keyword] = WordCloudItem(text=topic.keyword, value=60)
+
+        # Top 20 by weight — nlargest is O(n log 20) vs O(n log n) for a
+        # full sort whose tail we would discard anyway
+        word_cloud = heapq.nlargest(20, wc_by_text.values(), key=lambda x: x.value)
+
         # 2. Action Items (Derived placeholder)
         # In a real scenario, we would have an ActionItemCalculator.
         # For now, we use missing topics as suggested focus areas.
-        action_items = []
-        if goal_result.missing_topics:
-            for topic in goal_result.missing_topics:
-                action_items.append(f"'{topic}'에 대해 더 논의해보기")
-        
+        action_items = [
+            f"'{topic}'에 대해 더 논의해보기"
+            for topic in goal_result.missing_topics
+        ]
         if style_result.improvement_feedback:
-             action_items.append("매니저와의 피드백 세션 준비하기")
+            action_items.append("매니저와의 피드백 세션 준비하기")
 
-        return MemberReportResponse(
-            word_cloud=word_cloud[:20],  # Top 20 only
+        return _format_cache_store(key, MemberReportResponse(
+            word_cloud=word_cloud,
             alignment_score=goal_result.alignment_score,
             alignment_category=goal_result.alignment_category.upper(),
             action_items=action_items,
             meeting_duration=speech_result.meeting_duration,
             total_turns=speech_result.total_turns
+        ))
+
+    def format_combined_json(
+        self,
+        manager_report: ManagerReportResponse,
+        member_report: MemberReportResponse,
+        performed_at: str,
+    ) -> str:
+        """
+        Assemble the persisted report JSON in one serializer pass.
+
+        model_dump_json serializes each report once in pydantic-core;
+        stitching the envelope as strings avoids the model_dump() dict
+        plus a second full json.dumps walk over the same tree.
+        """
+        return self.combine_json_parts(
+            manager_report.model_dump_json(),
+            member_report.model_dump_json(),
+            performed_at,
+        )
+
+    def combine_json_parts(
+        self,
+        manager_json: str,
+        member_json: str,
+        performed_at: str,
+    ) -> str:
+        """
+        Stitch pre-serialized report JSON fragments into the envelope.
+
+        Lets callers that already hold the serialized reports (e.g. the
+        report cache) rebuild the envelope with a fresh timestamp without
+        re-serializing anything. performed_at must be an ISO timestamp
+        (contains no characters that would need JSON escaping).
+        """
+        return (
+            '{"manager":' + manager_json
+            + ',"member":' + member_json
+            + ',"performed_at":"' + performed_at + '"}'
         )
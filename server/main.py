@@ -4,11 +4,13 @@ FastAPI 애플리케이션 진입점
 AI 데이터 분석 웹 서비스의 메인 애플리케이션입니다.
 """
 
+import asyncio
+import contextlib
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
@@ -58,17 +60,33 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
 
     # 개발 환경에서는 테이블 자동 생성 (운영에서는 사용 금지!)
     if settings.ENVIRONMENT == "development" and settings.DEBUG:
-        print("⚠️  Development mode: Creating database tables...")
+        logger.warning("⚠️  Development mode: Creating database tables...")
         try:
             await DatabaseManager.create_tables()
         except Exception as e:
-            print(f"⚠️  DB 테이블 생성 실패 (무시됨): {e}")
+            logger.warning(f"⚠️  DB 테이블 생성 실패 (무시됨): {e}")
+
+    # 선제 토큰 갱신 루프 시작 (지연 import: 캘린더 도메인 미사용 시 미로드)
+    from server.app.domain.calendar.service import token_refresh_loop
+    token_refresh_task = asyncio.create_task(token_refresh_loop())
 
     yield
 
     # 종료 시 실행
     logger.info("👋 Shutting down application...")
+
+    # 선제 토큰 갱신 루프 중지
+    token_refresh_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await token_refresh_task
+
     await DatabaseManager.close_connections()
+
+    # 공유 Anthropic 클라이언트 정리 (지연 import: LLM 경로를 안 쓴 워커는
+    # anthropic을 로드하지 않은 채로 종료됩니다)
+    from server.app.calculators.llm_base import close_shared_client
+    await close_shared_client()
+
     logger.info("✅ Application shutdown complete")
 
 
@@ -120,6 +138,7 @@ def create_application() -> FastAPI:
         """,
         debug=settings.DEBUG,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,  # 응답 JSON 직렬화를 orjson으로
         # docs_url="/docs" if settings.DEBUG else None,  # 운영에서는 문서 비활성화 가능
         # redoc_url="/redoc" if settings.DEBUG else None,
     )
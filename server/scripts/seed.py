@@ -7,7 +7,9 @@ from dotenv import load_dotenv
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 load_dotenv(os.path.join(BASE_DIR, ".env"))
 
-from sqlalchemy import select
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import make_url
 from server.app.core.database import AsyncSessionLocal, DatabaseManager
 from server.app.core.config import settings
 from server.app.domain.company.models.company import Company
@@ -19,73 +21,85 @@ logger = logging.getLogger(__name__)
 
 async def seed_data():
     # 디버깅: DB URL 확인 (비번 마스킹)
-    db_url = str(settings.DATABASE_URL)
-    masked_url = db_url.replace(str(settings.POSTGRES_PASSWORD), "****") if settings.POSTGRES_PASSWORD else db_url
+    masked_url = make_url(str(settings.DATABASE_URL)).render_as_string(hide_password=True)
     logger.info(f"Connecting to DB: {masked_url}")
 
-    # 테이블 생성 (혹시 모르니)
+    # 테이블 생성 (스키마가 없을 때만 — 있으면 DDL 전체를 건너뜀)
     logger.info("Ensuring tables exist...")
-    await DatabaseManager.create_tables()
+    await DatabaseManager.ensure_tables()
 
+    # INSERT ... ON CONFLICT DO NOTHING RETURNING id 한 방으로 멱등 시딩 —
+    # 테이블당 SELECT-then-INSERT 왕복 두 번이 한 번으로 줄고, 동시에
+    # 여러 시더가 돌아도 check-then-insert 레이스가 없습니다. 이미 행이
+    # 있으면 RETURNING이 비므로 그때만 id를 SELECT로 보충합니다.
     async with AsyncSessionLocal() as db:
         try:
-            # 1. Check existing Company
-            stmt = select(Company).where(Company.domain == "vntgcorp.com")
-            result = await db.execute(stmt)
-            company = result.scalar_one_or_none()
-
-            if not company:
-                logger.info("Creating VNTG Company...")
-                company = Company(
+            # 1. Company (domain UNIQUE)
+            stmt = (
+                pg_insert(Company)
+                .values(
                     name="VNTG",
-                    business_number="123-45-67890", # Dummy
+                    business_number="123-45-67890",  # Dummy
                     domain="vntgcorp.com",
-                    is_active=True
+                    is_active=True,
                 )
-                db.add(company)
-                await db.flush() # ID 생성을 위해 flush
-            else:
-                logger.info("VNTG Company already exists.")
-
-            # 2. Check existing Root Department
-            stmt = select(Department).where(
-                Department.company_id == company.id, 
-                Department.parent_id == None
+                .on_conflict_do_nothing(index_elements=["domain"])
+                .returning(Company.id)
             )
-            result = await db.execute(stmt)
-            root_dept = result.scalar_one_or_none()
+            company_id = (await db.execute(stmt)).scalar()
+            if company_id is None:
+                logger.info("VNTG Company already exists.")
+                company_id = (
+                    await db.execute(
+                        select(Company.id).where(Company.domain == "vntgcorp.com")
+                    )
+                ).scalar_one()
+            else:
+                logger.info("Created VNTG Company.")
 
-            if not root_dept:
-                logger.info("Creating Root Department...")
-                root_dept = Department(
-                    company_id=company.id,
-                    name="VNTG HQ",
-                    parent_id=None
+            # 2. Root Department (회사당 루트 하나 — ix_departments_company_root)
+            stmt = (
+                pg_insert(Department)
+                .values(company_id=company_id, name="VNTG HQ", parent_id=None)
+                .on_conflict_do_nothing(
+                    index_elements=["company_id"],
+                    index_where=text("parent_id IS NULL"),
                 )
-                db.add(root_dept)
-                await db.flush()
-            else:
+                .returning(Department.id)
+            )
+            root_dept_id = (await db.execute(stmt)).scalar()
+            if root_dept_id is None:
                 logger.info("Root Department already exists.")
+                root_dept_id = (
+                    await db.execute(
+                        select(Department.id).where(
+                            Department.company_id == company_id,
+                            Department.parent_id.is_(None),
+                        )
+                    )
+                ).scalar_one()
+            else:
+                logger.info("Created Root Department.")
 
-            # 3. Check existing Admin User
+            # 3. Admin User (email UNIQUE)
             admin_email = "admin@vntgcorp.com"
-            stmt = select(User).where(User.email == admin_email)
-            result = await db.execute(stmt)
-            admin_user = result.scalar_one_or_none()
-
-            if not admin_user:
-                logger.info("Creating Admin User...")
-                admin_user = User(
-                    company_id=company.id,
-                    department_id=root_dept.id,
+            stmt = (
+                pg_insert(User)
+                .values(
+                    company_id=company_id,
+                    department_id=root_dept_id,
                     email=admin_email,
                     google_id="admin_google_id_dummy",
                     name="Admin User",
-                    role="admin"
+                    role="admin",
                 )
-                db.add(admin_user)
-            else:
+                .on_conflict_do_nothing(index_elements=["email"])
+                .returning(User.id)
+            )
+            if (await db.execute(stmt)).scalar() is None:
                 logger.info("Admin User already exists.")
+            else:
+                logger.info("Created Admin User.")
 
             await db.commit()
             logger.info("Seeding completed successfully.")
@@ -93,11 +107,17 @@ async def seed_data():
         except Exception as e:
             logger.error(f"Seeding failed: {e}")
             # 디버깅용 출력 (마지막에 보여지도록)
-            db_url = str(settings.DATABASE_URL)
-            masked = db_url.replace(settings.POSTGRES_PASSWORD, "****") if settings.POSTGRES_PASSWORD else db_url
-            print(f"\n[DEBUG] FAILED WITH DB_URL: {masked}")
+            print(f"\n[DEBUG] FAILED WITH DB_URL: {masked_url}")
             await db.rollback()
             raise
 
+async def main() -> None:
+    """시딩 후 엔진을 정리해 스크립트가 즉시 종료되도록 합니다."""
+    try:
+        await seed_data()
+    finally:
+        await DatabaseManager.close_connections()
+
+
 if __name__ == "__main__":
-    asyncio.run(seed_data())
+    asyncio.run(main())
@@ -12,6 +12,7 @@ import asyncio
 import logging
 import os
 import sys
+import uuid
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
@@ -22,7 +23,8 @@ sys.path.insert(0, BASE_DIR)
 # .env 로드 (스크립트 실행 시 필수)
 load_dotenv(os.path.join(BASE_DIR, ".env"))
 
-from sqlalchemy import select
+from sqlalchemy import select, text
+from sqlalchemy.engine import make_url
 from server.app.core.database import AsyncSessionLocal, DatabaseManager
 from server.app.core.config import settings
 from server.app.domain.company.models.company import Company
@@ -36,6 +38,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 시드 데이터 상수 — 함수 호출마다 재할당하지 않도록 모듈 수준으로 호이스팅
+COMPANY_DOMAIN = "vntg.company"
+MANAGER_EMAIL = f"manager@{COMPANY_DOMAIN}"
+MEMBER_EMAIL = f"member@{COMPANY_DOMAIN}"
+SCHEDULE_OFFSET = timedelta(days=3)
+
 
 async def seed_test_data() -> None:
     """
@@ -50,183 +58,250 @@ async def seed_test_data() -> None:
         Exception: 데이터베이스 작업 중 오류 발생 시
     """
     # 디버깅: DB URL 확인 (비밀번호 마스킹)
-    db_url = str(settings.DATABASE_URL)
-    masked_url = db_url.replace(str(settings.POSTGRES_PASSWORD), "****") if settings.POSTGRES_PASSWORD else db_url
-    logger.info(f"🔗 데이터베이스 연결: {masked_url}")
+    masked_url = make_url(str(settings.DATABASE_URL)).render_as_string(hide_password=True)
+    logger.info("🔗 데이터베이스 연결: %s", masked_url)
 
-    # 테이블 생성 (존재하지 않는 경우)
+    # 테이블 생성 (스키마가 없을 때만 — 있으면 DDL 전체를 건너뜀)
     logger.info("📋 테이블 존재 여부 확인 중...")
-    await DatabaseManager.create_tables()
+    await DatabaseManager.ensure_tables()
 
     async with AsyncSessionLocal() as db:
         try:
+            # 동시에 도는 시더(CI 병렬 잡 등)를 트랜잭션 범위 어드바이저리
+            # 락으로 직렬화 — 뒤따르는 실행은 잠깐 대기했다가 프로브에서
+            # 전부 존재함을 확인하고 빠져나가므로, 유니크 제약 경합으로
+            # 한쪽이 롤백되는 일이 없습니다. 락은 커밋/롤백 시 해제됩니다.
+            if db.bind.dialect.name == "postgresql":
+                await db.execute(
+                    text("SELECT pg_advisory_xact_lock(hashtext('seed_test_data'))")
+                )
+
+            # ==================== 0. 존재 여부 일괄 확인 ====================
+            # 엔티티별 SELECT 여섯 번(= 순차 왕복 여섯 번) 대신, 상호 참조를
+            # 상관 스칼라 서브쿼리로 엮은 프로브 한 방으로 여섯 id를 한
+            # 왕복에 가져옵니다. 이후 분기는 전부 로컬에서 처리합니다.
+            logger.info("🔎 기존 데이터 일괄 확인 중...")
+            company_id_sq = (
+                select(Company.id)
+                .where(Company.domain == COMPANY_DOMAIN)
+                .limit(1)
+                .scalar_subquery()
+            )
+            department_id_sq = (
+                select(Department.id)
+                .where(
+                    Department.company_id == company_id_sq,
+                    Department.name == "개발팀",
+                )
+                .limit(1)
+                .scalar_subquery()
+            )
+            manager_id_sq = (
+                select(User.id).where(User.email == MANAGER_EMAIL).limit(1).scalar_subquery()
+            )
+            member_id_sq = (
+                select(User.id).where(User.email == MEMBER_EMAIL).limit(1).scalar_subquery()
+            )
+            goal_id_sq = (
+                select(Goal.id).where(Goal.user_id == member_id_sq).limit(1).scalar_subquery()
+            )
+            session_id_sq = (
+                select(OneOnOneSession.id)
+                .where(
+                    OneOnOneSession.manager_id == manager_id_sq,
+                    OneOnOneSession.user_id == member_id_sq,
+                    OneOnOneSession.status == "scheduled",
+                )
+                .limit(1)
+                .scalar_subquery()
+            )
+            probe = select(
+                company_id_sq.label("company_id"),
+                department_id_sq.label("department_id"),
+                manager_id_sq.label("manager_id"),
+                member_id_sq.label("member_id"),
+                goal_id_sq.label("goal_id"),
+                session_id_sq.label("session_id"),
+            )
+            (
+                company_id,
+                department_id,
+                manager_id,
+                member_id,
+                goal_id,
+                session_id,
+            ) = (await db.execute(probe)).one()
+
+            # 누락된 엔티티는 의존 단계별로 모아 한 번에 flush합니다.
+            # flush마다 왕복이 발생하므로, 엔티티별 6회 대신 최대 3회
+            # (Company → Department/Users → Goal/Session)로 묶고, 같은
+            # 단계 안의 FK는 relationship으로 연결해 unit of work가
+            # INSERT 순서를 알아서 정렬하게 합니다.
+
             # ==================== 1. Company 생성 ====================
-            logger.info("🏢 Company 데이터 확인 중...")
-            company_domain = "vntg.company"
-            stmt = select(Company).where(Company.domain == company_domain)
-            result = await db.execute(stmt)
-            company = result.scalar_one_or_none()
-
-            if not company:
-                logger.info(f"✨ Company 생성: VNTG ({company_domain})")
+            if company_id is None:
+                logger.info("✨ Company 생성: VNTG (%s)", COMPANY_DOMAIN)
                 company = Company(
                     name="VNTG",
                     business_number="123-45-67890",
-                    domain=company_domain,
+                    domain=COMPANY_DOMAIN,
                     is_active=True
                 )
                 db.add(company)
                 await db.flush()  # ID 생성을 위해 flush
-                logger.info(f"✅ Company 생성 완료 (ID: {company.id})")
+                company_id = company.id
+                logger.info("✅ Company 생성 완료 (ID: %s)", company_id)
             else:
-                logger.info(f"ℹ️  Company 이미 존재 (ID: {company.id})")
+                logger.info("ℹ️  Company 이미 존재 (ID: %s)", company_id)
 
-            # ==================== 2. Department 생성 ====================
-            logger.info("🏗️  Department 데이터 확인 중...")
-            stmt = select(Department).where(
-                Department.company_id == company.id,
-                Department.name == "개발팀"
-            )
-            result = await db.execute(stmt)
-            department = result.scalar_one_or_none()
+            # ========== 2~4. Department / Manager / Member 생성 ==========
+            stage = []
 
-            if not department:
+            department = None
+            if department_id is None:
                 logger.info("✨ Department 생성: 개발팀")
                 department = Department(
-                    company_id=company.id,
+                    company_id=company_id,
                     name="개발팀",
                     parent_id=None
                 )
-                db.add(department)
-                await db.flush()
-                logger.info(f"✅ Department 생성 완료 (ID: {department.id})")
+                stage.append(department)
             else:
-                logger.info(f"ℹ️  Department 이미 존재 (ID: {department.id})")
-
-            # ==================== 3. Manager User 생성 ====================
-            logger.info("👔 Manager User 확인 중...")
-            manager_email = "manager@vntg.company"
-            stmt = select(User).where(User.email == manager_email)
-            result = await db.execute(stmt)
-            manager = result.scalar_one_or_none()
+                logger.info("ℹ️  Department 이미 존재 (ID: %s)", department_id)
 
-            if not manager:
-                logger.info(f"✨ Manager User 생성: 조직장 ({manager_email})")
+            manager = None
+            if manager_id is None:
+                logger.info("✨ Manager User 생성: 조직장 (%s)", MANAGER_EMAIL)
                 manager = User(
-                    company_id=company.id,
-                    department_id=department.id,
-                    email=manager_email,
-                    google_id=f"google_manager_{datetime.now().timestamp()}",
+                    company_id=company_id,
+                    email=MANAGER_EMAIL,
+                    google_id=f"google_manager_{uuid.uuid4().hex}",
                     name="조직장",
                     role="manager"
                 )
-                db.add(manager)
-                await db.flush()
-                logger.info(f"✅ Manager User 생성 완료 (ID: {manager.id})")
+                if department is not None:
+                    manager.department = department
+                else:
+                    manager.department_id = department_id
+                stage.append(manager)
             else:
-                logger.info(f"ℹ️  Manager User 이미 존재 (ID: {manager.id})")
-
-            # ==================== 4. Member User 생성 ====================
-            logger.info("👤 Member User 확인 중...")
-            member_email = "member@vntg.company"
-            stmt = select(User).where(User.email == member_email)
-            result = await db.execute(stmt)
-            member = result.scalar_one_or_none()
+                logger.info("ℹ️  Manager User 이미 존재 (ID: %s)", manager_id)
 
-            if not member:
-                logger.info(f"✨ Member User 생성: 팀원 ({member_email})")
+            member = None
+            if member_id is None:
+                logger.info("✨ Member User 생성: 팀원 (%s)", MEMBER_EMAIL)
                 member = User(
-                    company_id=company.id,
-                    department_id=department.id,
-                    email=member_email,
-                    google_id=f"google_member_{datetime.now().timestamp()}",
+                    company_id=company_id,
+                    email=MEMBER_EMAIL,
+                    google_id=f"google_member_{uuid.uuid4().hex}",
                     name="팀원",
                     role="member"
                 )
-                db.add(member)
-                await db.flush()
-                logger.info(f"✅ Member User 생성 완료 (ID: {member.id})")
+                if department is not None:
+                    member.department = department
+                else:
+                    member.department_id = department_id
+                stage.append(member)
             else:
-                logger.info(f"ℹ️  Member User 이미 존재 (ID: {member.id})")
+                logger.info("ℹ️  Member User 이미 존재 (ID: %s)", member_id)
+
+            if stage:
+                db.add_all(stage)
+                await db.flush()
+                if department is not None:
+                    department_id = department.id
+                    logger.info("✅ Department 생성 완료 (ID: %s)", department_id)
+                if manager is not None:
+                    manager_id = manager.id
+                    logger.info("✅ Manager User 생성 완료 (ID: %s)", manager_id)
+                if member is not None:
+                    member_id = member.id
+                    logger.info("✅ Member User 생성 완료 (ID: %s)", member_id)
 
-            # ==================== 5. Goal 생성 ====================
-            logger.info("🎯 Goal 데이터 확인 중...")
-            stmt = select(Goal).where(Goal.user_id == member.id)
-            result = await db.execute(stmt)
-            existing_goals = result.scalars().all()
+            # ========== 5~6. Goal / OneOnOneSession 생성 ==========
+            stage = []
 
-            if not existing_goals:
+            goal = None
+            if goal_id is None:
                 logger.info("✨ Goal 생성: Q1 백엔드 성능 개선")
                 goal = Goal(
-                    user_id=member.id,
+                    user_id=member_id,
                     content="Q1 백엔드 API 응답 시간 30% 개선",
                     criteria="평균 응답 시간 300ms 이하 달성, 모든 엔드포인트 p95 < 500ms",
                     status="in_progress"
                 )
-                db.add(goal)
-                await db.flush()
-                logger.info(f"✅ Goal 생성 완료 (ID: {goal.id})")
+                stage.append(goal)
             else:
-                logger.info(f"ℹ️  Goal 이미 존재 (개수: {len(existing_goals)})")
-
-            # ==================== 6. OneOnOneSession 생성 ====================
-            logger.info("📅 OneOnOneSession 확인 중...")
-            stmt = select(OneOnOneSession).where(
-                OneOnOneSession.manager_id == manager.id,
-                OneOnOneSession.user_id == member.id,
-                OneOnOneSession.status == "scheduled"
-            )
-            result = await db.execute(stmt)
-            session = result.scalar_one_or_none()
+                logger.info("ℹ️  Goal 이미 존재 (ID: %s)", goal_id)
 
-            if not session:
+            session = None
+            scheduled_time = None
+            if session_id is None:
                 logger.info("✨ OneOnOneSession 생성")
-                scheduled_time = datetime.now() + timedelta(days=3)
+                scheduled_time = datetime.now() + SCHEDULE_OFFSET
                 session = OneOnOneSession(
-                    company_id=company.id,
-                    user_id=member.id,
-                    manager_id=manager.id,
+                    company_id=company_id,
+                    user_id=member_id,
+                    manager_id=manager_id,
                     topic="Q1 성과 리뷰 및 커리어 개발 논의",
                     status="scheduled",
                     scheduled_at=scheduled_time,
                     report_data=None
                 )
-                db.add(session)
-                await db.flush()
-                logger.info(f"✅ OneOnOneSession 생성 완료 (ID: {session.id})")
-                logger.info(f"   📆 예정 시간: {scheduled_time.strftime('%Y-%m-%d %H:%M:%S')}")
+                stage.append(session)
             else:
-                logger.info(f"ℹ️  OneOnOneSession 이미 존재 (ID: {session.id})")
+                logger.info("ℹ️  OneOnOneSession 이미 존재 (ID: %s)", session_id)
+
+            # Goal/Session의 ID는 이후 문장에서 쓰이지 않으므로 별도
+            # flush 없이 커밋이 INSERT를 함께 내보내게 합니다 (왕복 1회
+            # 절약). ID는 커밋 후 로깅 시점에 읽습니다.
+            db.add_all(stage)
 
             # ==================== 7. Commit ====================
             await db.commit()
+            if goal is not None:
+                goal_id = goal.id
+                logger.info("✅ Goal 생성 완료 (ID: %s)", goal_id)
+            if session is not None:
+                session_id = session.id
+                logger.info("✅ OneOnOneSession 생성 완료 (ID: %s)", session_id)
+                logger.info("   📆 예정 시간: %s", scheduled_time.strftime('%Y-%m-%d %H:%M:%S'))
             logger.info("=" * 60)
             logger.info("🎉 테스트 데이터 생성 완료!")
             logger.info("=" * 60)
-            logger.info(f"📊 생성된 데이터 요약:")
-            logger.info(f"   - Company: {company.name} (ID: {company.id})")
-            logger.info(f"   - Manager: {manager.name} ({manager.email})")
-            logger.info(f"   - Member: {member.name} ({member.email})")
-            logger.info(f"   - OneOnOneSession ID: {session.id}")
-            logger.info(f"   - Session Status: {session.status}")
+            logger.info("📊 생성된 데이터 요약:")
+            logger.info("   - Company: VNTG (ID: %s)", company_id)
+            logger.info("   - Manager: 조직장 (%s)", MANAGER_EMAIL)
+            logger.info("   - Member: 팀원 (%s)", MEMBER_EMAIL)
+            logger.info("   - OneOnOneSession ID: %s", session_id)
+            logger.info("   - Session Status: scheduled")
             logger.info("=" * 60)
-            logger.info(f"🧪 /analyze 엔드포인트 테스트 가능:")
-            logger.info(f"   curl -X POST http://localhost:8000/api/v1/sessions/{session.id}/analyze")
+            logger.info("🧪 /analyze 엔드포인트 테스트 가능:")
+            logger.info("   curl -X POST http://localhost:8000/api/v1/sessions/%s/analyze", session_id)
             logger.info("=" * 60)
 
         except Exception as e:
-            logger.error(f"❌ 데이터 생성 실패: {e}")
+            logger.error("❌ 데이터 생성 실패: %s", e)
             await db.rollback()
             raise
 
 
+async def main() -> None:
+    """시딩 후 엔진을 정리해 스크립트가 즉시 종료되도록 합니다."""
+    try:
+        await seed_test_data()
+    finally:
+        # 풀에 남은 연결을 닫지 않으면 프로세스 종료가 지연될 수 있음
+        await DatabaseManager.close_connections()
+
+
 if __name__ == "__main__":
     logger.info("🚀 테스트 데이터 생성 스크립트 시작")
     logger.info("=" * 60)
     try:
-        asyncio.run(seed_test_data())
+        asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("\n⚠️  사용자에 의해 중단되었습니다.")
     except Exception as e:
-        logger.error(f"\n💥 스크립트 실행 중 오류 발생: {e}")
+        logger.error("\n💥 스크립트 실행 중 오류 발생: %s", e)
         raise